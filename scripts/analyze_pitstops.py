@@ -5,185 +5,263 @@ Najdeme kde jsou uloženy pitstopy v FastF1 datech
 
 import fastf1
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
-# Nastavení cache
-cache_dir = Path("../data/cache")
-fastf1.Cache.enable_cache(str(cache_dir))
-
-print("=" * 80)
-print("🏁 QATAR GP 2025 - Hledání pitstopů")
-print("=" * 80)
-
-# Načteme závod
-year = 2025
-race = "Qatar"
-session_type = "R"
-
-print(f"\n📥 Načítám {race} {year} - {session_type}...")
-session = fastf1.get_session(year, race, session_type)
-session.load()
-
-print(f"✅ Session načtena: {session.event['EventName']}")
-print(f"📅 Datum: {session.event['EventDate']}")
-
-# ══════════════════════════════════════════════════════════════════════════════
-# 1️⃣ CO JE DOSTUPNÉ V SESSION?
-# ══════════════════════════════════════════════════════════════════════════════
-print("\n" + "=" * 80)
-print("📊 DOSTUPNÉ DATASETY V SESSION:")
-print("=" * 80)
-
-print("\nVšechny atributy session:")
-attributes = [attr for attr in dir(session) if not attr.startswith('_')]
-for attr in sorted(attributes):
-    try:
-        value = getattr(session, attr)
-        if not callable(value):
+try:
+    import orjson
+
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    import json
+
+    def dumps(obj) -> bytes:
+        # NumPy pole i skaláry mají .tolist()
+        return json.dumps(obj, indent=2, default=lambda o: o.tolist()).encode()
+
+# Sloupce pitstopů, které v FastF1 Laps nemusí existovat (PitDuration tam není vůbec)
+OPTIONAL_PIT_COLUMNS = ['PitOutTime', 'PitDuration', 'LapTime', 'Compound', 'TyreLife', 'Stint']
+
+
+def pit_stop_arrays(pit_laps: pd.DataFrame) -> dict:
+    """
+    Sloupce pitstopů jako NumPy pole a masky dostupnosti
+    
+    Chybějící volitelný sloupec se chová jako samé NaN: časy jsou NaN,
+    celá čísla 0 a jeho maska dostupnosti je False.
+    """
+    pl = pit_laps.reindex(columns=['Driver', 'LapNumber', 'PitInTime', *OPTIONAL_PIT_COLUMNS])
+    
+    def seconds(col: str) -> np.ndarray:
+        if col not in pit_laps.columns:
+            return np.full(len(pl), np.nan)
+        return pl[col].dt.total_seconds().to_numpy()
+    
+    # Všechny masky dostupnosti jedním vektorovým voláním
+    has_pit_out, has_duration, has_lap_time, has_compound, has_tyre_life, has_stint = (
+        pl[OPTIONAL_PIT_COLUMNS].notna().to_numpy().T
+    )
+    
+    return {
+        'drivers': pl['Driver'].to_numpy(),
+        'lap_numbers': pl['LapNumber'].to_numpy(np.int32),
+        'stints': pl['Stint'].to_numpy(np.int32, na_value=0),
+        'pit_in_str': pl['PitInTime'].astype(str).to_numpy(),
+        'pit_out_str': pl['PitOutTime'].astype(str).to_numpy(),
+        'durations': seconds('PitDuration'),
+        'lap_times': seconds('LapTime'),
+        'compounds': pl['Compound'].to_numpy(),
+        'tyre_lives': pl['TyreLife'].to_numpy(np.int32, na_value=0),
+        'has_pit_out': has_pit_out,
+        'has_duration': has_duration,
+        'has_lap_time': has_lap_time,
+        'has_compound': has_compound,
+        'has_tyre_life': has_tyre_life,
+        'has_stint': has_stint,
+    }
+
+
+def main():
+    # Nastavení cache
+    cache_dir = Path("../data/cache")
+    fastf1.Cache.enable_cache(str(cache_dir))
+
+    print("=" * 80)
+    print("🏁 QATAR GP 2025 - Hledání pitstopů")
+    print("=" * 80)
+
+    # Načteme závod
+    year = 2025
+    race = "Qatar"
+    session_type = "R"
+
+    print(f"\n📥 Načítám {race} {year} - {session_type}...")
+    session = fastf1.get_session(year, race, session_type)
+
+    # Snapshot laps do Parquetu - opakované spuštění přeskočí session.load()
+    laps_snapshot = cache_dir / f"{year}_{race}_{session_type}_laps.parquet"
+    if laps_snapshot.exists():
+        print(f"⚡ Načítám laps ze snapshotu: {laps_snapshot}")
+        laps = pd.read_parquet(laps_snapshot, engine='pyarrow')
+    else:
+        session.load()
+        laps = session.laps
+        pd.DataFrame(laps).to_parquet(laps_snapshot, engine='pyarrow')
+
+    print(f"✅ Session načtena: {session.event['EventName']}")
+    print(f"📅 Datum: {session.event['EventDate']}")
+
+    # ══════════════════════════════════════════════════════════════════════════════
+    # 1️⃣ CO JE DOSTUPNÉ V SESSION?
+    # ══════════════════════════════════════════════════════════════════════════════
+    print("\n" + "=" * 80)
+    print("📊 DOSTUPNÉ DATASETY V SESSION:")
+    print("=" * 80)
+
+    # Pevný seznam atributů - dir(session) by sahal i na líné vlastnosti,
+    # které při přístupu spouští drahé výpočty (telemetrie apod.)
+    SAFE_ATTRS = [
+        'name', 'date', 'event', 'laps', 'results', 'session_status',
+        'weather_data', 'track_status', 'drivers', 'session_info'
+    ]
+
+    print("\nAtributy session:")
+    for attr in SAFE_ATTRS:
+        try:
+            value = getattr(session, attr, None)
             print(f"  • {attr:30s} = {type(value).__name__}")
-    except:
-        pass
-
-# ══════════════════════════════════════════════════════════════════════════════
-# 2️⃣ HLEDÁNÍ PITSTOPŮ V LAPS
-# ══════════════════════════════════════════════════════════════════════════════
-print("\n" + "=" * 80)
-print("🔍 HLEDÁNÍ PITSTOPŮ V LAPS:")
-print("=" * 80)
-
-laps = session.laps
-print(f"\nSloupce v laps DataFrame:")
-for col in laps.columns:
-    print(f"  • {col}")
-
-# Najdeme sloupce související s pitstopy
-pit_columns = [col for col in laps.columns if 'Pit' in col or 'pit' in col.lower()]
-print(f"\n🔧 Sloupce s 'Pit' v názvu:")
-for col in pit_columns:
-    print(f"  • {col}")
-
-# ══════════════════════════════════════════════════════════════════════════════
-# 3️⃣ PITSTOPY - DETAILNÍ ANALÝZA
-# ══════════════════════════════════════════════════════════════════════════════
-print("\n" + "=" * 80)
-print("🛠️  PITSTOPY - DETAILNÍ INFORMACE:")
-print("=" * 80)
-
-# Filtrujeme kola kde byl pitstop (PitInTime není null)
-pit_laps = laps[laps['PitInTime'].notna()].copy()
-
-print(f"\n📊 Celkový počet pitstopů: {len(pit_laps)}")
-
-if len(pit_laps) > 0:
+        except Exception:
+            print(f"  • {attr:30s} = (nenačteno)")
+
+    # ══════════════════════════════════════════════════════════════════════════════
+    # 2️⃣ HLEDÁNÍ PITSTOPŮ V LAPS
+    # ══════════════════════════════════════════════════════════════════════════════
+    print("\n" + "=" * 80)
+    print("🔍 HLEDÁNÍ PITSTOPŮ V LAPS:")
+    print("=" * 80)
+
+    print(f"\nSloupce v laps DataFrame:")
+    for col in laps.columns:
+        print(f"  • {col}")
+
+    # Najdeme sloupce související s pitstopy
+    pit_columns = [col for col in laps.columns if 'Pit' in col or 'pit' in col.lower()]
+    print(f"\n🔧 Sloupce s 'Pit' v názvu:")
+    for col in pit_columns:
+        print(f"  • {col}")
+
+    # ══════════════════════════════════════════════════════════════════════════════
+    # 3️⃣ PITSTOPY - DETAILNÍ ANALÝZA
+    # ══════════════════════════════════════════════════════════════════════════════
+    print("\n" + "=" * 80)
+    print("🛠️  PITSTOPY - DETAILNÍ INFORMACE:")
+    print("=" * 80)
+
     # Sloupce které chceme zobrazit
     pit_info_columns = [
         'Driver', 'LapNumber', 'Stint', 
         'PitInTime', 'PitOutTime', 'PitDuration',
         'Compound', 'TyreLife', 'LapTime'
     ]
-    
+
     # Ověříme které sloupce existují
-    available_cols = [col for col in pit_info_columns if col in pit_laps.columns]
-    
-    print(f"\nDostupné sloupce pro pitstopy:")
-    for col in available_cols:
-        print(f"  • {col}")
+    available_cols = [col for col in pit_info_columns if col in laps.columns]
+
+    # Filtrujeme kola kde byl pitstop (PitInTime není null) - jen čtení, bez .copy()
+    pit_laps = laps.loc[laps['PitInTime'].notna(), available_cols]
+
+    # Celočíselné sloupce přetypujeme jednou (pandas je drží jako float kvůli NaN),
+    # jen ty které existují
+    pit_laps = pit_laps.astype({
+        col: 'Int32' for col in ('LapNumber', 'Stint', 'TyreLife') if col in available_cols
+    })
+
+    print(f"\n📊 Celkový počet pitstopů: {len(pit_laps)}")
+
+    if len(pit_laps) > 0:
+        print(f"\nDostupné sloupce pro pitstopy:")
+        for col in available_cols:
+            print(f"  • {col}")
     
-    print("\n" + "=" * 80)
-    print("📋 VŠECHNY PITSTOPY:")
-    print("=" * 80)
+        print("\n" + "=" * 80)
+        print("📋 VŠECHNY PITSTOPY:")
+        print("=" * 80)
     
-    # Seřadíme podle času vjezdu
-    pit_laps_sorted = pit_laps.sort_values('PitInTime')
+        # Seřadíme podle času vjezdu (argsort nad int64 nanosekundami)
+        pit_in_order = pit_laps['PitInTime'].to_numpy().view('i8').argsort(kind='stable')
+        pit_laps_sorted = pit_laps.iloc[pit_in_order]
     
-    for idx, (_, pit) in enumerate(pit_laps_sorted.iterrows(), 1):
-        print(f"\n#{idx} {pit['Driver']} - Kolo {int(pit['LapNumber'])}")
-        print(f"   ├─ Stint:              {pit.get('Stint', 'N/A')}")
-        print(f"   ├─ PitInTime:          {pit['PitInTime']}")
+        # Sloupce převedeme na NumPy pole jednou, místo Series pro každý řádek
+        pit = pit_stop_arrays(pit_laps_sorted)
+        drivers_arr, lap_numbers, stints = pit['drivers'], pit['lap_numbers'], pit['stints']
+        pit_in_str, pit_out_str = pit['pit_in_str'], pit['pit_out_str']
+        durations, lap_times = pit['durations'], pit['lap_times']
+        compounds, tyre_lives = pit['compounds'], pit['tyre_lives']
+        has_pit_out, has_duration, has_lap_time = pit['has_pit_out'], pit['has_duration'], pit['has_lap_time']
+        has_compound, has_tyre_life, has_stint = pit['has_compound'], pit['has_tyre_life'], pit['has_stint']
+
+        for i in range(len(pit_laps_sorted)):
+            print(f"\n#{i + 1} {drivers_arr[i]} - Kolo {lap_numbers[i]}")
+            print(f"   ├─ Stint:              {stints[i] if has_stint[i] else 'N/A'}")
+            print(f"   ├─ PitInTime:          {pit_in_str[i]}")
         
-        if pd.notna(pit.get('PitOutTime')):
-            print(f"   ├─ PitOutTime:         {pit['PitOutTime']}")
+            if has_pit_out[i]:
+                print(f"   ├─ PitOutTime:         {pit_out_str[i]}")
         
-        if pd.notna(pit.get('PitDuration')):
-            duration = pit['PitDuration'].total_seconds() if hasattr(pit['PitDuration'], 'total_seconds') else pit['PitDuration']
-            print(f"   ├─ PitDuration:        {duration:.2f}s")
+            if has_duration[i]:
+                print(f"   ├─ PitDuration:        {durations[i]:.2f}s")
         
-        if pd.notna(pit.get('LapTime')):
-            lap_time = pit['LapTime'].total_seconds() if hasattr(pit['LapTime'], 'total_seconds') else pit['LapTime']
-            print(f"   ├─ LapTime:            {lap_time:.2f}s")
+            if has_lap_time[i]:
+                print(f"   ├─ LapTime:            {lap_times[i]:.2f}s")
         
-        if pd.notna(pit.get('Compound')):
-            print(f"   ├─ Pneumatika předtím: {pit['Compound']}")
+            if has_compound[i]:
+                print(f"   ├─ Pneumatika předtím: {compounds[i]}")
         
-        if pd.notna(pit.get('TyreLife')):
-            print(f"   └─ Stáří pneu:         {int(pit['TyreLife'])} kol")
-
-# ══════════════════════════════════════════════════════════════════════════════
-# 4️⃣ PITSTOP LAPS - SOUHRN PRO KAŽDÉHO JEZDCE
-# ══════════════════════════════════════════════════════════════════════════════
-print("\n" + "=" * 80)
-print("👥 PITSTOP LAPS PO JEZDCÍCH:")
-print("=" * 80)
-
-drivers = pit_laps_sorted['Driver'].unique()
-for driver in sorted(drivers):
-    driver_pits = pit_laps_sorted[pit_laps_sorted['Driver'] == driver]
-    pit_lap_numbers = driver_pits['LapNumber'].astype(int).tolist()
-    pit_lap_times = []
-    
-    for _, pit in driver_pits.iterrows():
-        if pd.notna(pit.get('LapTime')):
-            lap_time = pit['LapTime'].total_seconds() if hasattr(pit['LapTime'], 'total_seconds') else pit['LapTime']
-            pit_lap_times.append(f"Lap {int(pit['LapNumber'])} ({lap_time:.2f}s)")
-        else:
-            pit_lap_times.append(f"Lap {int(pit['LapNumber'])}")
+            if has_tyre_life[i]:
+                print(f"   └─ Stáří pneu:         {tyre_lives[i]} kol")
+
+
+    def pit_detail(i):
+        """Detail jednoho pitstopu z předpočítaných polí"""
+        detail = {
+            'lap': lap_numbers[i],
+            'stint': stints[i] if has_stint[i] else None,
+        }
+        if has_duration[i]:
+            detail['pit_duration'] = round(float(durations[i]), 2)
+        if has_lap_time[i]:
+            detail['lap_time'] = round(float(lap_times[i]), 2)
+        if has_compound[i]:
+            detail['compound_before'] = compounds[i]
+        if has_tyre_life[i]:
+            detail['tyre_life_before'] = tyre_lives[i]
+        return detail
+
+
+    # ══════════════════════════════════════════════════════════════════════════════
+    # 4️⃣ PITSTOP LAPS - SOUHRN PRO KAŽDÉHO JEZDCE
+    # ══════════════════════════════════════════════════════════════════════════════
+    print("\n" + "=" * 80)
+    print("👥 PITSTOP LAPS PO JEZDCÍCH:")
+    print("=" * 80)
+
+    # Jeden průchod přes jezdce: výpis souhrnu a zároveň struktura pro export
+    pitstop_data = {}
+    driver_groups = pit_laps_sorted.groupby('Driver', sort=True).indices
+    for driver, idx in sorted(driver_groups.items()):
+        pit_lap_numbers = lap_numbers[idx]
+        pit_lap_times = [
+            f"Lap {lap_numbers[i]} ({lap_times[i]:.2f}s)" if has_lap_time[i]
+            else f"Lap {lap_numbers[i]}"
+            for i in idx
+        ]
     
-    print(f"\n{driver}:")
-    print(f"  • Pitstop laps: {pit_lap_numbers}")
-    print(f"  • Details: {', '.join(pit_lap_times)}")
-
-# ══════════════════════════════════════════════════════════════════════════════
-# 5️⃣ EXPORTUJEME DO JSON PRO FRONTEND
-# ══════════════════════════════════════════════════════════════════════════════
-print("\n" + "=" * 80)
-print("💾 EXPORT DAT PRO FRONTEND:")
-print("=" * 80)
-
-# Vytvoříme strukturu pro každého jezdce
-pitstop_data = {}
-for driver in sorted(drivers):
-    driver_pits = pit_laps_sorted[pit_laps_sorted['Driver'] == driver]
-    pitstop_data[driver] = {
-        'laps': driver_pits['LapNumber'].astype(int).tolist(),
-        'details': []
-    }
+        print(f"\n{driver}:")
+        print(f"  • Pitstop laps: {pit_lap_numbers.tolist()}")
+        print(f"  • Details: {', '.join(pit_lap_times)}")
     
-    for _, pit in driver_pits.iterrows():
-        detail = {
-            'lap': int(pit['LapNumber']),
-            'stint': int(pit['Stint']) if pd.notna(pit.get('Stint')) else None,
+        pitstop_data[driver] = {
+            'laps': pit_lap_numbers,
+            'details': [pit_detail(i) for i in idx]
         }
-        
-        if pd.notna(pit.get('PitDuration')):
-            duration = pit['PitDuration'].total_seconds() if hasattr(pit['PitDuration'], 'total_seconds') else pit['PitDuration']
-            detail['pit_duration'] = round(duration, 2)
-        
-        if pd.notna(pit.get('LapTime')):
-            lap_time = pit['LapTime'].total_seconds() if hasattr(pit['LapTime'], 'total_seconds') else pit['LapTime']
-            detail['lap_time'] = round(lap_time, 2)
-        
-        if pd.notna(pit.get('Compound')):
-            detail['compound_before'] = pit['Compound']
-        
-        if pd.notna(pit.get('TyreLife')):
-            detail['tyre_life_before'] = int(pit['TyreLife'])
-        
-        pitstop_data[driver]['details'].append(detail)
 
-print("\n📦 Struktura dat:")
-import json
-print(json.dumps(pitstop_data, indent=2))
+    # ══════════════════════════════════════════════════════════════════════════════
+    # 5️⃣ EXPORTUJEME DO JSON PRO FRONTEND
+    # ══════════════════════════════════════════════════════════════════════════════
+    print("\n" + "=" * 80)
+    print("💾 EXPORT DAT PRO FRONTEND:")
+    print("=" * 80)
+
+    # Serializujeme rovnou do bytes (orjson, jinak json) a zapisujeme do souboru
+    export_path = cache_dir / 'pitstops.json'
+    export_path.write_bytes(dumps(pitstop_data))
+    print(f"\n📦 Data uložena: {export_path} ({len(pitstop_data)} jezdců)")
+
+    print("\n" + "=" * 80)
+    print("✅ ANALÝZA DOKONČENA")
+    print("=" * 80)
+
 
-print("\n" + "=" * 80)
-print("✅ ANALÝZA DOKONČENA")
-print("=" * 80)
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,83 @@
 """Analytics module for lap and race analysis"""
 
+import weakref
+
 import pandas as pd
 import numpy as np
 import structlog
 from typing import Optional
 
+from src.processing.lap_processor import timedelta_to_seconds
+
 logger = structlog.get_logger()
 
+# Timedelta columns and the cached float-seconds columns derived from them
+_SECONDS_COLUMNS = {
+    'LapTime': 'LapTimeSec',
+    'Sector1Time': 'S1Sec',
+    'Sector2Time': 'S2Sec',
+    'Sector3Time': 'S3Sec',
+}
+
+# Float seconds per live laps DataFrame: id(laps) -> (source arrays, {column: array}).
+# Entries are dropped when the DataFrame is garbage collected, so ids are never reused.
+_seconds_cache: dict[int, tuple[tuple, dict[str, np.ndarray]]] = {}
+
+
+def _source_arrays(laps: pd.DataFrame, columns) -> tuple:
+    """
+    The backing arrays of the given columns, as a cache validity token
+    
+    pandas hands out a new array object for a column after any write to
+    it (assignment, .loc/.iloc setitem, in-place arithmetic), so a token
+    that still matches by identity means the columns are unchanged. The
+    token holds the arrays, so their ids cannot be reused meanwhile.
+    """
+    return tuple(laps[column].array for column in columns if column in laps.columns)
+
+
+def _same_arrays(token: tuple, other: tuple) -> bool:
+    """True if two _source_arrays tokens hold the very same arrays"""
+    return len(token) == len(other) and all(a is b for a, b in zip(token, other))
+
+
+def _seconds(laps: pd.DataFrame) -> dict[str, np.ndarray]:
+    """
+    Float-seconds arrays for lap/sector times, computed once per DataFrame
+    
+    Arrays are kept in a side cache rather than added as columns, so the
+    caller's DataFrame (possibly a shared, memoized one) is never mutated.
+    
+    Args:
+        laps: Lap data with Timedelta time columns
+    
+    Returns:
+        Dict of *Sec names (see _SECONDS_COLUMNS) to float64 arrays, for
+        the time columns present
+    """
+    key = id(laps)
+    sources = _source_arrays(laps, _SECONDS_COLUMNS)
+    cached = _seconds_cache.get(key)
+    if cached is not None and _same_arrays(cached[0], sources):
+        return cached[1]
+    
+    seconds = {
+        dst: timedelta_to_seconds(laps[src])
+        for src, dst in _SECONDS_COLUMNS.items() if src in laps.columns
+    }
+    
+    if key not in _seconds_cache:
+        weakref.finalize(laps, _seconds_cache.pop, key, None)
+    _seconds_cache[key] = (sources, seconds)
+    
+    return seconds
+
+
+# Tyre degradation per live laps DataFrame: id(laps) -> (source arrays, result).
+# Entries are dropped when the DataFrame is garbage collected, so ids are never reused.
+_degradation_cache: dict[int, tuple[tuple, pd.DataFrame]] = {}
+_DEGRADATION_COLUMNS = ('Compound', 'LapTime')
+
 
 class LapAnalyzer:
     """Analyze lap performance and patterns"""
@@ -22,15 +93,22 @@ class LapAnalyzer:
         Returns:
             Dictionary with pace statistics
         """
-        lap_times = laps['LapTime'].dt.total_seconds()
+        lap_times = _seconds(laps)['LapTimeSec']
+        
+        # Single extraction, then NaN-aware NumPy reductions (min/median/max fused)
+        mean_pace = np.nanmean(lap_times)
+        std_pace = np.nanstd(lap_times, ddof=1)
+        fastest, median, slowest = (
+            np.nanpercentile(lap_times, [0, 50, 100]) if lap_times.size else (np.nan,) * 3
+        )
         
         analysis = {
-            'mean_pace': lap_times.mean(),
-            'median_pace': lap_times.median(),
-            'std_pace': lap_times.std(),
-            'fastest_lap': lap_times.min(),
-            'slowest_lap': lap_times.max(),
-            'consistency': lap_times.std() / lap_times.mean(),
+            'mean_pace': mean_pace,
+            'median_pace': median,
+            'std_pace': std_pace,
+            'fastest_lap': fastest,
+            'slowest_lap': slowest,
+            'consistency': std_pace / mean_pace,
         }
         
         logger.info("Pace analysis completed", **analysis)
@@ -42,41 +120,73 @@ class LapAnalyzer:
         """
         Analyze tyre degradation per stint
         
+        Results are memoized per DataFrame object (e.g. repeated
+        predict_optimal_strategy calls on the same session laps).
+        
         Args:
             laps: Lap data with tyre info
         
         Returns:
             DataFrame with degradation analysis per stint
         """
-        stints = []
-        
-        # Group by compound
-        for compound in laps['Compound'].unique():
-            if pd.isna(compound):
-                continue
-                
-            compound_laps = laps[laps['Compound'] == compound].copy()
-            compound_laps['TyreLife'] = range(1, len(compound_laps) + 1)
-            compound_laps['LapTimeSeconds'] = compound_laps['LapTime'].dt.total_seconds()
-            
-            # Calculate degradation (lap time increase per lap)
-            if len(compound_laps) > 1:
-                first_lap_time = compound_laps['LapTimeSeconds'].iloc[0]
-                last_lap_time = compound_laps['LapTimeSeconds'].iloc[-1]
-                degradation = (last_lap_time - first_lap_time) / len(compound_laps)
-            else:
-                degradation = 0
-            
-            stints.append({
-                'Compound': compound,
-                'StintLength': len(compound_laps),
-                'AvgLapTime': compound_laps['LapTimeSeconds'].mean(),
-                'DegradationPerLap': degradation,
-                'FirstLapTime': first_lap_time if len(compound_laps) > 0 else None,
-                'LastLapTime': last_lap_time if len(compound_laps) > 0 else None,
-            })
-        
-        return pd.DataFrame(stints)
+        key = id(laps)
+        sources = _source_arrays(laps, _DEGRADATION_COLUMNS)
+        cached = _degradation_cache.get(key)
+        if cached is not None and _same_arrays(cached[0], sources):
+            return cached[1].copy()
+        
+        result = LapAnalyzer._compute_tyre_degradation(laps)
+        
+        if key not in _degradation_cache:
+            weakref.finalize(laps, _degradation_cache.pop, key, None)
+        _degradation_cache[key] = (sources, result)
+        
+        return result.copy()
+
+    @staticmethod
+    def _compute_tyre_degradation(laps: pd.DataFrame) -> pd.DataFrame:
+        """Uncached tyre degradation computation (see analyze_tyre_degradation)"""
+        has_compound = laps['Compound'].notna().to_numpy()
+        compounds = laps['Compound'].to_numpy()[has_compound]
+        times = _seconds(laps)['LapTimeSec'][has_compound]
+        
+        # Stable sort keeps each compound's laps in their original order
+        order = np.argsort(compounds, kind='stable')
+        compounds_sorted = compounds[order]
+        times_sorted = times[order]
+        
+        uniques, starts = np.unique(compounds_sorted, return_index=True)
+        if len(uniques) == 0:
+            return pd.DataFrame(columns=[
+                'Compound', 'StintLength', 'AvgLapTime',
+                'DegradationPerLap', 'FirstLapTime', 'LastLapTime'
+            ])
+        
+        ends = np.r_[starts[1:], len(compounds_sorted)]
+        lengths = ends - starts
+        
+        valid = ~np.isnan(times_sorted)
+        sums = np.add.reduceat(np.where(valid, times_sorted, 0.0), starts)
+        counts = np.add.reduceat(valid.astype(np.intp), starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+        
+        first = times_sorted[starts]
+        last = times_sorted[ends - 1]
+        # Calculate degradation (lap time increase per lap)
+        degradation = np.where(lengths > 1, (last - first) / lengths, 0.0)
+        
+        # Report compounds in order of first appearance, as before
+        appearance = np.argsort(order[starts], kind='stable')
+        
+        return pd.DataFrame({
+            'Compound': uniques[appearance],
+            'StintLength': lengths[appearance],
+            'AvgLapTime': means[appearance],
+            'DegradationPerLap': degradation[appearance],
+            'FirstLapTime': first[appearance],
+            'LastLapTime': last[appearance],
+        })
 
     @staticmethod
     def find_optimal_lap(laps: pd.DataFrame) -> pd.Series:
@@ -89,24 +199,24 @@ class LapAnalyzer:
         Returns:
             Series with optimal lap data
         """
-        best_s1 = laps['Sector1Time'].min()
-        best_s2 = laps['Sector2Time'].min()
-        best_s3 = laps['Sector3Time'].min()
-        
-        optimal_time = best_s1 + best_s2 + best_s3
+        # One frame-level reduction instead of a min() call per sector
+        best = laps[['Sector1Time', 'Sector2Time', 'Sector3Time']].min()
+        # A sector with no valid time leaves the optimal lap undefined (NaT)
+        optimal_time = best.sum(skipna=False)
+        best_seconds = best.dt.total_seconds()
         
         logger.info(
             "Optimal lap calculated",
-            sector1=best_s1.total_seconds(),
-            sector2=best_s2.total_seconds(),
-            sector3=best_s3.total_seconds(),
+            sector1=best_seconds['Sector1Time'],
+            sector2=best_seconds['Sector2Time'],
+            sector3=best_seconds['Sector3Time'],
             total=optimal_time.total_seconds()
         )
         
         return pd.Series({
-            'Sector1Time': best_s1,
-            'Sector2Time': best_s2,
-            'Sector3Time': best_s3,
+            'Sector1Time': best['Sector1Time'],
+            'Sector2Time': best['Sector2Time'],
+            'Sector3Time': best['Sector3Time'],
             'OptimalLapTime': optimal_time
         })
 
@@ -129,39 +239,37 @@ class ComparisonAnalyzer:
         Returns:
             Dictionary with comparison metrics
         """
+        d1_seconds = _seconds(driver1_laps)
+        d2_seconds = _seconds(driver2_laps)
+        
         d1_name = driver1_laps['Driver'].iloc[0]
         d2_name = driver2_laps['Driver'].iloc[0]
         
-        # Reset index to ensure proper comparison
-        driver1_laps = driver1_laps.reset_index(drop=True)
-        driver2_laps = driver2_laps.reset_index(drop=True)
-        
-        d1_times = driver1_laps['LapTime'].dt.total_seconds()
-        d2_times = driver2_laps['LapTime'].dt.total_seconds()
+        d1_times = d1_seconds['LapTimeSec']
+        d2_times = d2_seconds['LapTimeSec']
         
-        # Get common laps for proper comparison
-        min_len = min(len(d1_times), len(d2_times))
-        d1_times_common = d1_times.iloc[:min_len].reset_index(drop=True)
-        d2_times_common = d2_times.iloc[:min_len].reset_index(drop=True)
+        # Get common laps for proper comparison (positional views, no copies)
+        min_len = min(d1_times.size, d2_times.size)
+        d1_times_common = d1_times[:min_len]
+        d2_times_common = d2_times[:min_len]
         
         comparison = {
             'driver1': d1_name,
             'driver2': d2_name,
-            'avg_gap': d1_times.mean() - d2_times.mean(),
-            'fastest_lap_gap': d1_times.min() - d2_times.min(),
-            'driver1_faster_laps': int((d1_times_common < d2_times_common).sum()),
-            'driver2_faster_laps': int((d2_times_common < d1_times_common).sum()),
-            'driver1_consistency': float(d1_times.std()),
-            'driver2_consistency': float(d2_times.std()),
+            'avg_gap': np.nanmean(d1_times) - np.nanmean(d2_times),
+            'fastest_lap_gap': np.nanmin(d1_times) - np.nanmin(d2_times),
+            'driver1_faster_laps': int(np.sum(d1_times_common < d2_times_common)),
+            'driver2_faster_laps': int(np.sum(d2_times_common < d1_times_common)),
+            'driver1_consistency': float(np.nanstd(d1_times, ddof=1)),
+            'driver2_consistency': float(np.nanstd(d2_times, ddof=1)),
         }
         
-        # Sector comparison
+        # Sector comparison over the cached seconds arrays both drivers have
         for sector in [1, 2, 3]:
-            col = f'Sector{sector}Time'
-            if col in driver1_laps.columns and col in driver2_laps.columns:
-                s1 = driver1_laps[col].dt.total_seconds().mean()
-                s2 = driver2_laps[col].dt.total_seconds().mean()
-                comparison[f'sector{sector}_gap'] = float(s1 - s2)
+            col = f'S{sector}Sec'
+            if col in d1_seconds and col in d2_seconds:
+                gap = np.nanmean(d1_seconds[col]) - np.nanmean(d2_seconds[col])
+                comparison[f'sector{sector}_gap'] = float(gap)
             else:
                 comparison[f'sector{sector}_gap'] = 0.0
         
@@ -182,31 +290,27 @@ class ComparisonAnalyzer:
         Returns:
             DataFrame with overtake events
         """
-        overtakes = []
-        
-        for lap_num in laps['LapNumber'].unique():
-            lap_data = laps[laps['LapNumber'] == lap_num].sort_values('Position')
-            
-            if lap_num > 1:
-                prev_lap = laps[laps['LapNumber'] == lap_num - 1]
-                
-                for _, driver in lap_data.iterrows():
-                    prev_pos = prev_lap[prev_lap['Driver'] == driver['Driver']]['Position']
-                    
-                    if not prev_pos.empty:
-                        prev_pos = prev_pos.iloc[0]
-                        curr_pos = driver['Position']
-                        
-                        if prev_pos > curr_pos:
-                            overtakes.append({
-                                'Lap': lap_num,
-                                'Driver': driver['Driver'],
-                                'FromPosition': prev_pos,
-                                'ToPosition': curr_pos,
-                                'PositionsGained': prev_pos - curr_pos
-                            })
-        
-        return pd.DataFrame(overtakes)
+        # Lap x Driver position matrix; shift by lap number (not row) so
+        # missing laps don't compare against the wrong previous lap
+        pos = laps.pivot_table(index='LapNumber', columns='Driver', values='Position', observed=True)
+        prev_pos = pos.set_axis(pos.index + 1).reindex(pos.index)
+        
+        curr = pos.to_numpy()
+        prev = prev_pos.to_numpy()
+        gained = prev - curr
+        lap_idx, drv_idx = np.nonzero(gained > 0)
+        
+        # Order by lap, then by position within the lap
+        order = np.lexsort((curr[lap_idx, drv_idx], lap_idx))
+        lap_idx, drv_idx = lap_idx[order], drv_idx[order]
+        
+        return pd.DataFrame({
+            'Lap': pos.index.to_numpy(np.int32)[lap_idx],
+            'Driver': pos.columns.to_numpy()[drv_idx],
+            'FromPosition': prev[lap_idx, drv_idx],
+            'ToPosition': curr[lap_idx, drv_idx],
+            'PositionsGained': gained[lap_idx, drv_idx],
+        })
 
 
 class StrategyAnalyzer:
@@ -223,25 +327,14 @@ class StrategyAnalyzer:
         Returns:
             DataFrame with pit stop analysis
         """
-        pit_laps = laps[laps['PitInTime'].notna()].copy()
-        
-        pit_stops = []
-        
-        for _, lap in pit_laps.iterrows():
-            pit_in = lap['PitInTime']
-            pit_out = lap['PitOutTime']
-            
-            if pd.notna(pit_in) and pd.notna(pit_out):
-                pit_duration = (pit_out - pit_in).total_seconds()
-                
-                pit_stops.append({
-                    'Driver': lap['Driver'],
-                    'Lap': lap['LapNumber'],
-                    'PitDuration': pit_duration,
-                    'Compound': lap['Compound'],
-                })
-        
-        df = pd.DataFrame(pit_stops)
+        pit_laps = laps[laps['PitInTime'].notna() & laps['PitOutTime'].notna()]
+        
+        df = pd.DataFrame({
+            'Driver': pit_laps['Driver'].to_numpy(),
+            'Lap': pit_laps['LapNumber'].to_numpy(np.int32),
+            'PitDuration': timedelta_to_seconds(pit_laps['PitOutTime'] - pit_laps['PitInTime']),
+            'Compound': pit_laps['Compound'].to_numpy(),
+        })
         
         if not df.empty:
             logger.info(
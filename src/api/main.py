@@ -1,23 +1,332 @@
 """FastAPI application for F1 analytics"""
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from starlette.datastructures import Headers
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Any, Awaitable, Callable, Optional, List
 import structlog
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from anyio import to_thread
+import numpy as np
+import orjson
 import pandas as pd
-from functools import lru_cache
+import polars as pl
+import pyarrow as pa
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
+import asyncio
+import base64
+import gzip
+import hashlib
+import os
+import re
+import sys
+import threading
+import time
 
 from src.ingestion.fastf1_loader import F1DataLoader
-from src.processing.lap_processor import LapProcessor
+from src.processing.lap_processor import LapProcessor, timedelta_to_seconds
 from src.analytics.lap_analyzer import LapAnalyzer, ComparisonAnalyzer
 
 logger = structlog.get_logger()
 
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback for values orjson can't serialize natively (e.g. non-contiguous arrays)"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Smallest dtype that holds each telemetry/layout channel (Throttle is 0-100,
+# Brake/DRS/gear are small enums, RPM stays below 20k)
+_TELEMETRY_DTYPES = {
+    'Distance': np.float32,
+    'Speed': np.float32,
+    'Throttle': np.uint8,
+    'Brake': np.uint8,
+    'nGear': np.uint8,
+    'RPM': np.uint16,
+    'DRS': np.uint8,
+    'x': np.float32,
+    'y': np.float32,
+    'distance': np.float32,
+}
+
+
+def _downcast_arrays(arrays: dict) -> dict:
+    """
+    Cast channels to their compact dtypes from _TELEMETRY_DTYPES
+    
+    Float sources for integer channels are rounded and clipped, with
+    missing samples (NaN) becoming 0.
+    
+    Args:
+        arrays: Channel name -> array
+    
+    Returns:
+        Channel name -> downcast array
+    """
+    downcast = {}
+    for name, values in arrays.items():
+        dtype = np.dtype(_TELEMETRY_DTYPES[name])
+        values = np.asarray(values)
+        if dtype.kind in 'ui' and values.dtype.kind == 'f':
+            info = np.iinfo(dtype)
+            values = np.clip(np.rint(np.nan_to_num(values)), info.min, info.max)
+        downcast[name] = values.astype(dtype, copy=False)
+    return downcast
+
+
+def _encode_arrays(arrays: dict) -> dict:
+    """
+    Encode channels as base64 of their raw little-endian bytes
+    
+    Args:
+        arrays: Channel name -> array, keys from _TELEMETRY_DTYPES
+    
+    Returns:
+        Channel name -> {"dtype", "len", "data"} for typed-array decoding
+    """
+    encoded = {}
+    for name, values in _downcast_arrays(arrays).items():
+        packed = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder('<'))
+        encoded[name] = {
+            'dtype': packed.dtype.name,
+            'len': packed.size,
+            'data': base64.b64encode(packed.tobytes()).decode('ascii'),
+        }
+    return encoded
+
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def _telemetry_arrow(payload: dict) -> bytes:
+    """
+    Encode a /telemetry payload as one Arrow IPC stream
+    
+    Both laps go into a single table (long format, dictionary-encoded
+    "Driver" column) with the downcast channel dtypes; the remaining
+    fields are stored as JSON in the schema metadata under "telemetry".
+    
+    Args:
+        payload: Result of _telemetry_payload with downcast NumPy channels
+    
+    Returns:
+        Arrow IPC stream bytes
+    """
+    laps = [payload["lap1"], payload["lap2"]]
+    drivers = [payload["driver1"], payload["driver2"]]
+    channels = laps[0]["telemetry"].keys()
+    lengths = [len(lap["telemetry"]["Distance"]) for lap in laps]
+    
+    columns = {
+        "Driver": pa.DictionaryArray.from_arrays(
+            np.repeat(np.arange(2, dtype=np.int8), lengths), pa.array(drivers)
+        ),
+        **{
+            name: np.concatenate([lap["telemetry"][name] for lap in laps])
+            for name in channels
+        },
+    }
+    metadata = {
+        "driver1": payload["driver1"],
+        "driver2": payload["driver2"],
+        **{
+            key: {field: value for field, value in lap.items() if field != "telemetry"}
+            for key, lap in (("lap1", laps[0]), ("lap2", laps[1]))
+        },
+    }
+    table = pa.table(columns).replace_schema_metadata({"telemetry": orjson.dumps(metadata)})
+    
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+class NumpyORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that serializes NumPy arrays and scalars without .tolist()"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+def _serialize(payload: Any) -> tuple[bytes, str]:
+    """
+    Serialize a response payload once and derive its ETag
+    
+    Args:
+        payload: JSON-serializable content (NumPy values allowed)
+    
+    Returns:
+        Tuple of (JSON body, quoted ETag)
+    """
+    body = orjson.dumps(payload, default=_orjson_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return body, _etag(body)
+
+
+# Smallest body worth compressing (GZipMiddleware and _cached_json_response)
+GZIP_MINIMUM_SIZE = 1024
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag for a serialized body"""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _is_past_season(year: int) -> bool:
+    """Whether a season is over, so its data no longer changes"""
+    return year < datetime.now(timezone.utc).year
+
+
+def _cache_headers(year: int) -> dict[str, str]:
+    """
+    Cache-Control for a season's data
+    
+    Past seasons never change, so browsers and proxies may keep them for
+    a year; the current season is still being updated.
+    
+    Args:
+        year: Season year
+    
+    Returns:
+        Response headers to add
+    """
+    if _is_past_season(year):
+        return {"Cache-Control": "public, max-age=31536000, immutable"}
+    return {"Cache-Control": "public, max-age=300"}
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match covers the given ETag (weak comparison)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    etag = etag.removeprefix("W/")
+    return if_none_match.strip() == "*" or etag in (
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    )
+
+
+@lru_cache(maxsize=256)
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Whether an Accept-Encoding header allows gzip
+    
+    q-values are honoured ("gzip;q=0" refuses gzip) and "*" covers gzip
+    when gzip itself is not listed.
+    
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+    
+    Returns:
+        True if a gzip-encoded response is acceptable
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    return qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0))) > 0
+
+
+class QualityAwareGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that skips clients refusing gzip via q-values"""
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and not _accepts_gzip(
+            Headers(scope=scope).get("accept-encoding", "")
+        ):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+@lru_cache(maxsize=64)
+def _gzip_body(body: bytes) -> bytes:
+    """Gzip a static payload once at the highest level (memoized per body)"""
+    return gzip.compress(body, compresslevel=9)
+
+
+def _cached_json_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    year: int,
+    precompress: bool = False
+) -> Response:
+    """
+    Send a pre-serialized JSON body, or 304 if the client already has it
+    
+    Bodies large enough for compression are gzip-encoded here rather than
+    by GZipMiddleware, so the gzip representation gets its own strong ETag
+    (the body's ETag with a "-gzip" suffix), as RFC 9110 requires.
+    
+    Args:
+        request: Incoming request (If-None-Match, Accept-Encoding)
+        body: Serialized JSON
+        etag: ETag of body
+        year: Season year (selects Cache-Control)
+        precompress: Serve a memoized gzip of body, so static payloads
+            aren't recompressed on every request
+    
+    Returns:
+        304, or the JSON (possibly gzip-encoded) response
+    """
+    headers = _cache_headers(year)
+    gzipped = False
+    if len(body) >= GZIP_MINIMUM_SIZE:
+        headers["Vary"] = "Accept-Encoding"
+        if _accepts_gzip(request.headers.get("accept-encoding", "")):
+            gzipped = True
+            etag = f'{etag[:-1]}-gzip"'
+    
+    headers["ETag"] = etag
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    if gzipped:
+        headers["Content-Encoding"] = "gzip"
+        body = _gzip_body(body) if precompress else gzip.compress(body, compresslevel=5)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Per-worker startup and shutdown: thread pool, Redis connection, cache warm-up"""
+    await configure_thread_pool()
+    await connect_redis()
+    await warm_session_cache()
+    yield
+    for task in _background_tasks:
+        task.cancel()
+    await close_redis()
+
+
 app = FastAPI(
     title="F1 Data Analytics API",
     description="API for F1 telemetry and race data analysis",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=NumpyORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -29,21 +338,646 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize data loader
-loader = F1DataLoader()
+# Compress large JSON bodies (telemetry and layout arrays compress 5-10x)
+app.add_middleware(QualityAwareGZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=5)
+
+# Bump to invalidate client/CDN copies of past-season responses after a data fix
+DATA_VERSION = os.getenv("DATA_VERSION", "1")
+_SEASON_IN_PATH = re.compile(r"/((?:19|20)\d{2})(?:/|$)")
+
+
+@app.middleware("http")
+async def past_season_etag(request: Request, call_next):
+    """
+    Revalidate past-season GETs by URL, before any data is loaded
+    
+    Past seasons never change, so the ETag is derived from the URL and
+    DATA_VERSION alone: a matching If-None-Match gets a 304 without
+    running the handler. Responses that set their own (content) ETag
+    keep it.
+    """
+    match = _SEASON_IN_PATH.search(request.url.path)
+    if request.method != "GET" or match is None:
+        return await call_next(request)
+    
+    year = int(match.group(1))
+    if not _is_past_season(year):
+        return await call_next(request)
+    
+    url = f"{request.url.path}?{request.url.query}|{DATA_VERSION}"
+    etag = f'W/"{hashlib.blake2b(url.encode(), digest_size=8).hexdigest()}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag, **_cache_headers(year)})
+    
+    response = await call_next(request)
+    if response.status_code == 200 and "etag" not in response.headers:
+        response.headers["ETag"] = etag
+    return response
+
+
+@app.middleware("http")
+async def coalesce_identical_gets(request: Request, call_next):
+    """
+    Run identical concurrent GETs once and send every caller the same response
+    
+    Requests are identical when URL and the headers that change the
+    response match: If-None-Match, Accept-Encoding, and Origin (CORS,
+    inside this middleware, writes Access-Control-Allow-Origin per
+    origin). The first request's response body is buffered and copied to
+    the others, so a burst on a cold cache executes the pipeline once.
+    
+    This layer saves the whole pipeline (middleware, serialization,
+    compression) for exact duplicates only. The single-flights further
+    in still matter: /telemetry shares its computation across requests
+    that differ in these headers, and get_clean_laps_async shares a
+    driver's laps across /sectors, /comparison and /analysis/pace.
+    """
+    if request.method != "GET":
+        return await call_next(request)
+    
+    key = "request:" + "|".join((
+        str(request.url),
+        request.headers.get("if-none-match", ""),
+        request.headers.get("accept-encoding", ""),
+        request.headers.get("origin", ""),
+    ))
+    
+    async def buffered() -> tuple[int, list[tuple[bytes, bytes]], bytes]:
+        response = await call_next(request)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        raw_headers = [(k, v) for k, v in response.raw_headers if k != b"content-length"]
+        return response.status_code, raw_headers, body
+    
+    status_code, raw_headers, body = await _single_flight(key, buffered)
+    response = Response(body, status_code=status_code)
+    response.raw_headers = [*raw_headers, (b"content-length", str(len(body)).encode())]
+    return response
+
+# Single shared data loader for the process, kept on app.state so every
+# handler and helper uses (and tests can swap) the same instance
+app.state.loader = F1DataLoader()
+
+# Bounded LRU cache of loaded sessions (each holds hundreds of MB of laps/telemetry)
+SESSION_CACHE_SIZE = 8
+_session_cache: OrderedDict[str, Any] = OrderedDict()
+_session_cache_lock = threading.Lock()
+# Per-key locks so concurrent cold requests load a session only once;
+# each entry is [lock, callers holding or waiting on it]
+_session_load_locks: dict[str, list] = {}
+# Per-session {driver code: laps} index, built on first per-driver lookup
+_laps_by_driver: dict[str, dict[str, Any]] = {}
+# Per-session {(function name, *args): result} memos (see _session_memo)
+_session_memos: dict[str, dict[tuple, Any]] = {}
+# When each cache entry was loaded (UTC), to spot sessions cached before they finished
+_session_loaded_at: dict[str, pd.Timestamp] = {}
+
+
+def _cache_put(cache_key: str, value: Any) -> None:
+    """Insert into the session LRU and evict the oldest entries (caller holds the lock)"""
+    _session_cache[cache_key] = value
+    _session_loaded_at[cache_key] = pd.Timestamp.now(tz='UTC')
+    while len(_session_cache) > SESSION_CACHE_SIZE:
+        evicted_key, _ = _session_cache.popitem(last=False)
+        logger.info("Evicted cached session", cache_key=evicted_key)
+        _drop_session_state(evicted_key)
+
+
+def _drop_session_state(cache_key: str) -> None:
+    """Forget what was derived from a removed cache entry (caller holds the lock)"""
+    # Memoized telemetry, driver index and clean laps keep the evicted session's laps alive
+    _laps_by_driver.pop(cache_key.removesuffix("_laps"), None)
+    _session_memos.pop(cache_key.removesuffix("_laps"), None)
+    _session_loaded_at.pop(cache_key, None)
+
+
+@contextmanager
+def _session_load_lock(cache_key: str):
+    """
+    Hold the load lock for a session key
+    
+    Entries are created and dropped under _session_cache_lock and only
+    once no caller holds or waits on them, so the table stays bounded
+    and two callers never end up with different locks for one key.
+    """
+    with _session_cache_lock:
+        entry = _session_load_locks.setdefault(cache_key, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _session_cache_lock:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _session_load_locks[cache_key]
+
+
+def _session_memo(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Memoize func(year, race, session_type, *args) per cached session
+    
+    Results are kept only while the session (or its laps snapshot) is in
+    the LRU cache and are dropped with it on eviction, leaving other
+    sessions' entries in place. Memoized results are shared: read-only.
+    """
+    @wraps(func)
+    def wrapper(year: int, race: int, session_type: str, *args: Any) -> Any:
+        cache_key = f"{year}_{race}_{session_type}"
+        memo_key = (func.__name__, *args)
+        with _session_cache_lock:
+            memo = _session_memos.get(cache_key)
+            if memo is not None and memo_key in memo:
+                return memo[memo_key]
+        
+        result = func(year, race, session_type, *args)
+        
+        with _session_cache_lock:
+            # A session evicted meanwhile would never drop this entry
+            if cache_key in _session_cache or f"{cache_key}_laps" in _session_cache:
+                _session_memos.setdefault(cache_key, {})[memo_key] = result
+        return result
+    
+    return wrapper
 
-# Simple in-memory cache for session data
-_session_cache = {}
 
 def get_cached_session(year: int, race: int, session_type: str):
-    """Get cached session or load and cache it"""
+    """Get cached session or load and cache it (LRU-bounded, thread-safe)"""
     cache_key = f"{year}_{race}_{session_type}"
-    if cache_key not in _session_cache:
+    with _session_load_lock(cache_key):
+        with _session_cache_lock:
+            session_obj = _session_cache.get(cache_key)
+            if session_obj is not None:
+                _session_cache.move_to_end(cache_key)
+        
+        if session_obj is not None:
+            logger.info("Using cached session", year=year, race=race, session=session_type)
+            return session_obj
+        
         logger.info("Loading session (not cached)", year=year, race=race, session=session_type)
-        _session_cache[cache_key] = loader.load_session(year, race, session_type)
-    else:
-        logger.info("Using cached session", year=year, race=race, session=session_type)
-    return _session_cache[cache_key]
+        session_obj = app.state.loader.load_session(year, race, session_type)
+        # Share the laps with other workers/restarts via the on-disk snapshot
+        app.state.loader.save_laps_snapshot(
+            year, race, session_type, session_obj.laps, max_age=_derived_max_age(year)
+        )
+        
+        with _session_cache_lock:
+            _cache_put(cache_key, session_obj)
+        
+        return session_obj
+
+
+def get_cached_laps(year: int, race: int, session_type: str):
+    """
+    Get session laps, avoiding a full FastF1 load when possible
+    
+    Lookup order: loaded session in memory, laps snapshot in memory,
+    Parquet snapshot on disk, full session load. Disk snapshots follow
+    the derived cache lifetime, so a live season's laps are refreshed.
+    
+    Args:
+        year: Season year
+        race: Race round number
+        session_type: Session identifier
+    
+    Returns:
+        FastF1 Laps for the session
+    """
+    cache_key = f"{year}_{race}_{session_type}"
+    laps_key = f"{cache_key}_laps"
+    with _session_cache_lock:
+        for key in (cache_key, laps_key):
+            cached = _session_cache.get(key)
+            if cached is not None:
+                _session_cache.move_to_end(key)
+                return cached.laps if key == cache_key else cached
+    
+    laps = app.state.loader.load_laps_snapshot(
+        year, race, session_type, max_age=_derived_max_age(year)
+    )
+    if laps is None:
+        return get_cached_session(year, race, session_type).laps
+    
+    with _session_cache_lock:
+        _cache_put(laps_key, laps)
+    return laps
+
+
+def get_cached_driver_laps(year: int, race: int, session_type: str, driver: str):
+    """
+    One driver's session laps via a per-session index (no full-column mask per call)
+    
+    Args:
+        year: Season year
+        race: Race round number
+        session_type: Session identifier
+        driver: Driver code (driver numbers fall back to pick_driver)
+    
+    Returns:
+        FastF1 Laps for the driver (empty if the driver has none)
+    """
+    cache_key = f"{year}_{race}_{session_type}"
+    with _session_cache_lock:
+        by_driver = _laps_by_driver.get(cache_key)
+    
+    if by_driver is None or driver not in by_driver:
+        laps = get_cached_laps(year, race, session_type)
+        if by_driver is None:
+            # iloc keeps the Laps type and its session reference (for telemetry)
+            by_driver = {
+                code: laps.iloc[positions]
+                for code, positions in laps.groupby('Driver', sort=False, observed=True).indices.items()
+            }
+            with _session_cache_lock:
+                _laps_by_driver[cache_key] = by_driver
+        if driver not in by_driver:
+            return laps.pick_driver(driver)
+    
+    return by_driver[driver]
+
+
+def _derived_max_age(year: int) -> Optional[int]:
+    """Disk cache lifetime for processed frames: forever for past seasons, a minute for the live one"""
+    return None if _is_past_season(year) else 60
+
+
+def get_derived(
+    year: int,
+    race: int,
+    name: str,
+    build: Callable[[], pd.DataFrame]
+) -> pd.DataFrame:
+    """
+    Get a processed DataFrame from the on-disk Parquet cache, or build and store it
+    
+    Warm entries let a fresh worker answer without loading the FastF1 session.
+    
+    Args:
+        year: Season year
+        race: Race round number
+        name: Cache entry name, unique per endpoint/session/driver
+        build: Produces the frame on a miss (attrs such as EventName are persisted)
+    
+    Returns:
+        Cached or freshly built DataFrame
+    """
+    frame = app.state.loader.load_derived(year, race, name, max_age=_derived_max_age(year))
+    if frame is None:
+        frame = build()
+        app.state.loader.save_derived(year, race, name, frame)
+    return frame
+
+
+@_session_memo
+def _fastest_telemetry(year: int, race: int, session_type: str, driver: Optional[str]):
+    """
+    Fastest lap and its merged telemetry, memoized per session and driver
+    
+    Lap.get_telemetry() merges car and position data with resampling,
+    which is deterministic per lap and too expensive to redo per request.
+    
+    Args:
+        year: Season year
+        race: Race round number
+        session_type: Session identifier
+        driver: Driver code, or None for the overall fastest lap
+    
+    Returns:
+        Tuple of (fastest lap, telemetry DataFrame), or (None, None)
+    """
+    session_obj = get_cached_session(year, race, session_type)
+    fastest = app.state.loader.get_fastest_lap(session_obj, driver)
+    if fastest is None:
+        return None, None
+    return fastest, fastest.get_telemetry()
+
+
+@_session_memo
+def _get_clean_laps(year: int, race: int, session_type: str, driver: str) -> pd.DataFrame:
+    """
+    A driver's cleaned laps, memoized per session and driver
+    
+    /sectors, /comparison and /analysis/pace all start from the same
+    pick_driver + clean_lap_times pipeline; the shared DataFrame must be
+    treated as read-only.
+    
+    Args:
+        year: Season year
+        race: Race round number
+        session_type: Session identifier
+        driver: Driver code
+    
+    Returns:
+        Cleaned lap data (pit and inaccurate laps removed)
+    """
+    return LapProcessor.clean_lap_times(get_cached_driver_laps(year, race, session_type, driver))
+
+
+# In-flight computations for single-flight request coalescing
+_inflight: dict[str, asyncio.Task] = {}
+
+
+async def _single_flight(key: str, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run coro_factory() once per key; concurrent callers await the same result
+    
+    Args:
+        key: Identity of the computation (e.g. endpoint and parameters)
+        coro_factory: Creates the coroutine to run when no call is in flight
+    
+    Returns:
+        Result of the shared computation (exceptions propagate to every caller)
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(coro_factory())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so one disconnecting client doesn't cancel the work for the others
+    return await asyncio.shield(task)
+
+
+async def get_clean_laps_async(year: int, race: int, session_type: str, driver: str) -> pd.DataFrame:
+    """
+    Awaitable _get_clean_laps, single-flighted per session and driver
+    
+    A burst of cold requests (a dashboard's first render) shares one
+    offloaded load instead of parking a worker thread per request on
+    the session's load lock.
+    
+    Args:
+        year: Season year
+        race: Race round number
+        session_type: Session identifier
+        driver: Driver code
+    
+    Returns:
+        Cleaned laps for the driver (shared - do not modify)
+    """
+    return await _single_flight(
+        f"clean_laps:{year}_{race}_{session_type}_{driver}",
+        lambda: to_thread.run_sync(_get_clean_laps, year, race, session_type, driver)
+    )
+
+
+# Worker threads shared by offloaded FastF1/pandas work (AnyIO default is 40)
+THREAD_POOL_SIZE = 64
+
+
+async def configure_thread_pool():
+    """Size the AnyIO thread limiter used by to_thread.run_sync"""
+    to_thread.current_default_thread_limiter().total_tokens = THREAD_POOL_SIZE
+
+
+# Optional Redis tier for serialized payloads, shared by all workers
+# (unset REDIS_URL to run with the in-process caches only)
+REDIS_URL = os.getenv("REDIS_URL")
+_redis: Optional[aioredis.Redis] = None
+
+
+def _payload_ttl(year: int) -> int:
+    """Redis TTL in seconds: a day for past seasons, a minute for the live one"""
+    return 24 * 3600 if _is_past_season(year) else 60
+
+
+def _season_cache(maxsize: int) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Memoize a payload builder f(year, *args) in process, per season policy
+    
+    Past seasons use an LRU of maxsize entries for the worker's lifetime;
+    live-season results expire after _payload_ttl(year), like the Redis
+    tier, so schedule and entry-list updates are picked up. .refresh()
+    rebuilds a live entry immediately; the undecorated builder stays
+    available as .uncached.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        past_season = lru_cache(maxsize=maxsize)(func)
+        live: dict[tuple, tuple[float, Any]] = {}
+        
+        @wraps(func)
+        def wrapper(year: int, *args: Any) -> Any:
+            if _is_past_season(year):
+                return past_season(year, *args)
+            
+            hit = live.get((year, *args))
+            if hit is not None and hit[0] > time.monotonic():
+                return hit[1]
+            return refresh(year, *args)
+        
+        def refresh(year: int, *args: Any) -> Any:
+            """Rebuild a live-season entry now, bypassing the memo (past seasons are final)"""
+            if _is_past_season(year):
+                return past_season(year, *args)
+            
+            value = func(year, *args)
+            now = time.monotonic()
+            # Keep the live table bounded: drop expired entries, then everything
+            for stale_key, (expires, _) in list(live.items()):
+                if expires <= now:
+                    live.pop(stale_key, None)
+            if len(live) >= maxsize:
+                live.clear()
+            live[(year, *args)] = (now + _payload_ttl(year), value)
+            return value
+        
+        wrapper.uncached = func
+        wrapper.refresh = refresh
+        return wrapper
+    
+    return decorator
+
+
+async def _shared_payload(
+    key: str,
+    year: int,
+    build: Callable[..., tuple[bytes, str]],
+    *args: Any
+) -> tuple[bytes, str]:
+    """
+    Serialized payload from Redis, or built in a worker thread and stored there
+    
+    Redis errors are logged and treated as a miss, so the API keeps
+    working (uncached) when Redis is down.
+    
+    Args:
+        key: Payload key (namespaced under "f1:" in Redis)
+        year: Season year (selects the TTL)
+        build: Payload builder returning (body, ETag)
+        *args: Arguments for build
+    
+    Returns:
+        Tuple of (JSON body, ETag)
+    """
+    key = f"f1:{key}"
+    if _redis is not None:
+        try:
+            body = await _redis.get(key)
+            if body is not None:
+                return body, _etag(body)
+        except (RedisError, OSError) as e:
+            logger.warning("Redis read failed", key=key, err=str(e))
+    
+    body, etag = await to_thread.run_sync(build, *args)
+    
+    if _redis is not None:
+        try:
+            await _redis.setex(key, _payload_ttl(year), body)
+        except (RedisError, OSError) as e:
+            logger.warning("Redis write failed", key=key, err=str(e))
+    
+    return body, etag
+
+
+async def connect_redis():
+    """Connect the shared payload cache when REDIS_URL is configured"""
+    global _redis
+    if REDIS_URL:
+        _redis = aioredis.from_url(REDIS_URL)
+        logger.info("Redis payload cache enabled")
+
+
+async def close_redis():
+    """Close the Redis connection pool"""
+    if _redis is not None:
+        await _redis.aclose()
+
+
+# Preload the schedule and latest completed race on startup (set WARM_CACHE=false
+# to disable); WARM_CACHE_INTERVAL > 0 repeats it every N seconds, so a race that
+# finishes during a live weekend is loaded before the first user asks for it
+WARM_CACHE_ON_STARTUP = os.getenv("WARM_CACHE", "true").lower() not in ("0", "false", "no")
+WARM_CACHE_INTERVAL = int(os.getenv("WARM_CACHE_INTERVAL", "0"))
+_background_tasks: set[asyncio.Task] = set()
+
+
+# A race is treated as finished this long after its scheduled start
+# (2 h race limit, plus suspensions and FastF1 data publication)
+RACE_FINISH_MARGIN = pd.Timedelta(hours=4)
+
+
+def _race_end_times(schedule: pd.DataFrame) -> dict[int, pd.Timestamp]:
+    """
+    Expected finish (UTC) of each round's race
+    
+    Uses the race session's scheduled start plus RACE_FINISH_MARGIN;
+    rounds without session times fall back to the end of the event date.
+    
+    Args:
+        schedule: FastF1 event schedule
+    
+    Returns:
+        {round number: finish time}
+    """
+    race_start = pd.Series(pd.NaT, index=schedule.index, dtype='datetime64[ns, UTC]')
+    for i in range(1, 6):
+        name, start = f'Session{i}', f'Session{i}DateUtc'
+        if name in schedule.columns and start in schedule.columns:
+            is_race = (schedule[name] == 'Race').to_numpy()
+            race_start = race_start.where(~is_race, pd.to_datetime(schedule[start], utc=True))
+    
+    event_day_end = pd.to_datetime(schedule['EventDate'], utc=True).dt.normalize() + pd.Timedelta(days=1)
+    ends = (race_start + RACE_FINISH_MARGIN).fillna(event_day_end)
+    return dict(zip(schedule['RoundNumber'].astype(int), ends))
+
+
+def _evict_unfinished_sessions(year: int, race_ends: dict[int, pd.Timestamp]) -> None:
+    """
+    Drop cached sessions of a season that were loaded before their race finished
+    
+    Such sessions hold partial laps; dropping them makes the next request
+    (or warm-up) load the final data.
+    
+    Args:
+        year: Season year
+        race_ends: {round number: race finish time} (see _race_end_times)
+    """
+    now = pd.Timestamp.now(tz='UTC')
+    with _session_cache_lock:
+        for cache_key, loaded_at in list(_session_loaded_at.items()):
+            key_year, key_race = cache_key.split("_")[:2]
+            if key_year != str(year) or not key_race.isdigit():
+                continue
+            race_end = race_ends.get(int(key_race))
+            if race_end is not None and loaded_at < race_end <= now:
+                _session_cache.pop(cache_key, None)
+                _drop_session_state(cache_key)
+                logger.info("Evicted session cached before the race finished", cache_key=cache_key)
+
+
+def _prewarm_session_cache() -> None:
+    """Refresh the current season's schedule payload and warm its most recent finished race"""
+    year = datetime.now(timezone.utc).year
+    try:
+        # Rebuilt on every run, not served from the payload memo
+        _races_payload.refresh(year)
+        schedule = app.state.loader.get_race_schedule(year)
+        race_ends = _race_end_times(schedule[schedule['RoundNumber'] > 0])
+        _evict_unfinished_sessions(year, race_ends)
+        
+        now = pd.Timestamp.now(tz='UTC')
+        finished = [race for race, race_end in race_ends.items() if race_end <= now]
+        if not finished:
+            logger.info("No completed race to prewarm", year=year)
+            return
+        
+        race = max(finished)
+        get_cached_session(year, race, "R")
+        logger.info("Session cache warmed", year=year, race=race)
+    except Exception as e:
+        logger.warning("Session cache warm-up failed", year=year, err=str(e))
+
+
+async def _warm_cache_loop() -> None:
+    """Run the warm-up once, then every WARM_CACHE_INTERVAL seconds if set"""
+    while True:
+        await to_thread.run_sync(_prewarm_session_cache)
+        if WARM_CACHE_INTERVAL <= 0:
+            return
+        await asyncio.sleep(WARM_CACHE_INTERVAL)
+
+
+# Open lock file of the worker that owns the warm-up; kept for the process
+# lifetime, the OS releases the lock when the worker exits
+_warm_lock_file = None
+
+
+def _acquire_warm_lock() -> bool:
+    """
+    Take the warm-up lock so only one worker process prewarms
+    
+    The other workers still benefit through the shared on-disk FastF1
+    cache and laps snapshots the warm-up writes.
+    
+    Returns:
+        True if this process holds the lock
+    """
+    global _warm_lock_file
+    if _warm_lock_file is not None:
+        return True
+    lock_file = open(app.state.loader.cache_dir / ".warm.lock", "a+b")
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    _warm_lock_file = lock_file
+    return True
+
+
+async def warm_session_cache():
+    """Start the cache warm-up in a worker thread without delaying startup"""
+    if not WARM_CACHE_ON_STARTUP:
+        return
+    if not _acquire_warm_lock():
+        logger.info("Cache warm-up runs in another worker", pid=os.getpid())
+        return
+    task = asyncio.create_task(_warm_cache_loop())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
 
 # Pydantic models
@@ -81,10 +1015,90 @@ def root():
     }
 
 
+def _aggregate_safety_car_periods(sc_data: list[dict]) -> list[dict]:
+    """
+    Merge Safety Car/VSC messages into periods with start and end laps
+    
+    A deployment message opens a period (closing any open one), an
+    ending message closes it (or forms a single-lap period if none is
+    open), and other messages extend an open period's end lap. The
+    messages are classified with vectorized string ops and split into
+    segments at each deployment and after each ending, so every
+    segment yields at most one period.
+    
+    Args:
+        sc_data: Messages with 'lap', 'type' and 'reason' keys
+    
+    Returns:
+        List of periods (start_lap, end_lap, type, reason)
+    """
+    messages = pd.DataFrame.from_records(sc_data, columns=['lap', 'type', 'reason'])
+    messages[['type', 'reason']] = messages[['type', 'reason']].fillna('')
+    reasons_upper = messages['reason'].str.upper()
+    
+    # Skip CHEQUERED FLAG
+    keep = ~reasons_upper.str.contains('CHEQUERED FLAG', regex=False)
+    messages, reasons_upper = messages[keep], reasons_upper[keep]
+    if messages.empty:
+        return []
+    
+    # Deployment / end messages (deployment wins when a message matches both)
+    is_deployment = reasons_upper.str.contains('DEPLOYED', regex=False).to_numpy()
+    is_end = reasons_upper.str.contains('IN THIS LAP|ENDING').to_numpy() & ~is_deployment
+    
+    seg_starts = np.flatnonzero(is_deployment | np.r_[True, is_end[:-1]])
+    seg_ends = np.r_[seg_starts[1:], len(messages)] - 1
+    opened = is_deployment[seg_starts]
+    
+    # Segments opened by a deployment run to their last message; others only
+    # produce a (single-lap) period when they end with an ending message
+    emit = opened | is_end[seg_ends]
+    first = np.where(opened, seg_starts, seg_ends)[emit]
+    last = seg_ends[emit]
+    
+    laps = messages['lap'].to_numpy(dtype=object)
+    types = messages['type'].to_numpy(dtype=object)
+    reasons = messages['reason'].to_numpy(dtype=object)
+    return [
+        {
+            'start_lap': laps[i],
+            'end_lap': laps[j],
+            'type': types[i],
+            'reason': reasons[i]
+        }
+        for i, j in zip(first, last)
+    ]
+
+
+def _safety_car_payload(year: int, race: int) -> tuple[bytes, str]:
+    """Serialized Safety Car periods and ETag for a race (see get_safety_car_periods)"""
+    def build() -> pd.DataFrame:
+        session = get_cached_session(year, race, "R")
+        # Raises on failure, so an error is never persisted as "no incidents"
+        sc_data = app.state.loader.get_safety_car_periods(session)
+        
+        incidents = pd.DataFrame.from_records(
+            [incident.to_dict() for incident in sc_data],
+            columns=['lap', 'type', 'reason']
+        )
+        incidents.attrs['EventName'] = session.event['EventName']
+        return incidents
+    
+    incidents = get_derived(year, race, "incidents_R", build)
+    
+    return _serialize({
+        "year": year,
+        "race": race,
+        "event": incidents.attrs['EventName'],
+        "safety_car_periods": _aggregate_safety_car_periods(incidents.to_dict('records'))
+    })
+
+
 @app.get("/safety-car/{year}/{race}")
-def get_safety_car_periods(
+async def get_safety_car_periods(
     year: int,
-    race: int
+    race: int,
+    request: Request
 ):
     """
     Get Safety Car and VSC periods for a race (aggregated into intervals)
@@ -92,125 +1106,167 @@ def get_safety_car_periods(
     Args:
         year: Season year
         race: Race round number
+        request: Incoming request (for If-None-Match)
     
     Returns:
         Safety Car periods information with start and end laps
     """
     try:
-        loader = F1DataLoader()
-        session = loader.load_session(year, race, "R")
-        sc_data = loader.get_safety_car_periods(session)
-        
-        # Aggregate Safety Car periods into intervals
-        aggregated = []
-        current_period = None
-        
-        for item in sc_data:
-            lap = item.get('lap')
-            sc_type = item.get('type', '')
-            reason = item.get('reason', '')
-            reason_upper = reason.upper()
-            
-            # Skip CHEQUERED FLAG
-            if 'CHEQUERED FLAG' in reason_upper:
-                continue
-            
-            # Check if this is a deployment or end message
-            is_deployment = any(keyword in reason_upper for keyword in [
-                'DEPLOYED', 'SC DEPLOYED', 'VSC DEPLOYED'
-            ])
-            is_end = any(keyword in reason_upper for keyword in [
-                'IN THIS LAP', 'ENDING', 'VSC ENDING', 'SC ENDING'
-            ])
-            
-            if is_deployment:
-                # Close previous period if exists
-                if current_period is not None:
-                    aggregated.append(current_period)
-                
-                # Start new period
-                current_period = {
-                    'start_lap': lap,
-                    'end_lap': lap,
-                    'type': sc_type,
-                    'reason': reason
-                }
-            elif is_end:
-                if current_period is not None:
-                    # Set end lap and close period
-                    current_period['end_lap'] = lap
-                    aggregated.append(current_period)
-                    current_period = None
-                else:
-                    # End without clear start - create single lap period
-                    aggregated.append({
-                        'start_lap': lap,
-                        'end_lap': lap,
-                        'type': sc_type,
-                        'reason': reason
-                    })
-            elif current_period is not None:
-                # Update end lap for any other SC/VSC related message
-                # but don't close the period
-                current_period['end_lap'] = lap
-        
-        # Close any open period
-        if current_period is not None:
-            aggregated.append(current_period)
-        
-        return {
-            "year": year,
-            "race": race,
-            "event": session.event['EventName'],
-            "safety_car_periods": aggregated
+        payload = await _shared_payload(
+            f"safety-car:{year}:{race}", year, _safety_car_payload, year, race
+        )
+        return _cached_json_response(request, *payload, year)
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Failed to get Safety Car data", year=year, race=race)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@_season_cache(maxsize=64)
+def _races_payload(year: int) -> tuple[bytes, str]:
+    """Serialized race schedule and ETag for a season (see get_races)"""
+    schedule = app.state.loader.get_race_schedule(year)
+    
+    # Format dates as YYYY-MM-DD only (no time), vectorized over the column
+    event_dates = schedule['EventDate']
+    if pd.api.types.is_datetime64_any_dtype(event_dates):
+        date_strs = event_dates.dt.strftime('%Y-%m-%d')
+    else:
+        date_strs = event_dates.astype(str).str.split().str[0]
+    
+    races = [
+        {
+            "round": round_number,
+            "race_name": event_name,
+            "country": country,
+            "circuit": location,
+            "date": date_str
         }
-    except Exception as e:
-        logger.error("Failed to get Safety Car data", err=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+        for round_number, event_name, country, location, date_str in zip(
+            schedule['RoundNumber'], schedule['EventName'], schedule['Country'],
+            schedule['Location'], date_strs
+        )
+    ]
+    
+    return _serialize(races)
 
 
-@app.get("/races/{year}", response_model=List[RaceInfo])
-def get_races(year: int):
+@app.get("/races/{year}", responses={200: {"model": List[RaceInfo]}})
+async def get_races(year: int, request: Request):
     """
     Get race schedule for a season
     
     Args:
         year: Season year
+        request: Incoming request (for If-None-Match)
     
     Returns:
         List of races
     """
     try:
         logger.info("Fetching races", year=year)
-        schedule = loader.get_race_schedule(year)
-        
-        races = []
-        for _, race in schedule.iterrows():
-            # Format date as YYYY-MM-DD only (no time)
-            event_date = race['EventDate']
-            if hasattr(event_date, 'date'):
-                date_str = event_date.date().isoformat()
-            else:
-                date_str = str(event_date).split()[0] if ' ' in str(event_date) else str(event_date)
-            
-            races.append({
-                "round": race['RoundNumber'],
-                "race_name": race['EventName'],
-                "country": race['Country'],
-                "circuit": race['Location'],
-                "date": date_str
-            })
-        
-        return races
-    except Exception as e:
-        logger.error("Failed to fetch races", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+        
+        # Pre-serialized body: dicts already match RaceInfo, skip response_model validation
+        payload = await _shared_payload(f"races:{year}", year, _races_payload, year)
+        return _cached_json_response(request, *payload, year)
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Failed to fetch races", year=year)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+# Lap columns read by _pit_stop_records (plus the driver they belong to)
+_PIT_STOP_COLUMNS = [
+    'Driver', 'LapNumber', 'Stint', 'PitInTime', 'PitOutTime', 'PitDuration',
+    'LapTime', 'Compound', 'TyreLife'
+]
+
+
+def _pit_stop_records(pit_laps: pd.DataFrame) -> list[dict]:
+    """
+    Pit stop dicts for laps with a PitInTime, built column-wise
+    
+    Args:
+        pit_laps: Laps where the driver entered the pits
+    
+    Returns:
+        One dict per lap; "stint" is None when unknown, other missing
+        optional fields are left out
+    """
+    missing = pd.Series(np.nan, index=pit_laps.index)
+    
+    def column(name: str) -> pd.Series:
+        return pit_laps[name] if name in pit_laps.columns else missing
+    
+    def seconds(name: str) -> pd.Series:
+        if name not in pit_laps.columns:
+            return missing
+        return pd.Series(timedelta_to_seconds(pit_laps[name]), index=pit_laps.index)
+    
+    stops = pd.DataFrame({
+        'lap': pit_laps['LapNumber'].astype('Int64'),
+        'stint': column('Stint').astype('Int64'),
+        'pit_in_time': seconds('PitInTime'),
+        'pit_out_time': seconds('PitOutTime'),
+        'pit_duration': seconds('PitDuration'),
+        'lap_time': seconds('LapTime'),
+        'compound_before': column('Compound'),
+        'tyre_life_before': column('TyreLife').astype('Int64'),
+    })
+    records = stops.astype(object).where(stops.notna(), None).to_dict('records')
+    
+    return [
+        {key: value for key, value in record.items() if value is not None or key == 'stint'}
+        for record in records
+    ]
+
+
+def _pitstops_payload(year: int, race: int, session: str) -> tuple[bytes, str]:
+    """Serialized pit stops and ETag for a race session (see get_race_pitstops)"""
+    def build() -> pd.DataFrame:
+        session_obj = get_cached_session(year, race, session)
+        laps = session_obj.laps
+        
+        # Filter laps with pit stops (PitInTime is not null)
+        pit_laps = pd.DataFrame(laps.loc[
+            laps['PitInTime'].notna(),
+            [column for column in _PIT_STOP_COLUMNS if column in laps.columns]
+        ])
+        pit_laps.attrs['EventName'] = session_obj.event['EventName']
+        return pit_laps
+    
+    pit_laps = get_derived(year, race, f"pitstops_{session}", build)
+    
+    # Drivers in order of first appearance; each driver's stops by pit entry time
+    drivers = pit_laps['Driver'].unique()
+    pit_laps = pit_laps.sort_values('PitInTime', kind='stable')
+    records = _pit_stop_records(pit_laps)
+    positions = pit_laps.groupby('Driver', sort=False, observed=True).indices
+    
+    pitstops_by_driver = {}
+    for driver_code in drivers:
+        pit_stops = [records[i] for i in positions[driver_code]]
+        pitstops_by_driver[driver_code] = {
+            "driver": driver_code,
+            "total_stops": len(pit_stops),
+            "stops": pit_stops
+        }
+    
+    return _serialize({
+        "race": pit_laps.attrs['EventName'],
+        "year": year,
+        "total_drivers": len(pitstops_by_driver),
+        "pitstops": pitstops_by_driver
+    })
 
 
 @app.get("/pitstops/{year}/{race}")
-def get_race_pitstops(
+async def get_race_pitstops(
     year: int,
     race: int,
+    request: Request,
     session: str = Query("R", description="Session type (R for race)")
 ):
     """
@@ -222,6 +1278,7 @@ def get_race_pitstops(
     Args:
         year (int): Season year (e.g., 2024, 2025)
         race (int): Race round number (1-24 depending on season)
+        request (Request): Incoming request (for If-None-Match)
         session (str, optional): Session type. Defaults to "R" (Race).
             Options: "FP1", "FP2", "FP3", "Q" (Qualifying), "S" (Sprint), "R" (Race)
     
@@ -277,68 +1334,37 @@ def get_race_pitstops(
     try:
         logger.info("Fetching pit stops", year=year, race=race, session=session)
         
-        # Load session
-        session_obj = loader.load_session(year, race, session)
-        
-        # Get all laps
-        laps = session_obj.laps
-        
-        # Filter laps with pit stops (PitInTime is not null)
-        pit_laps = laps[laps['PitInTime'].notna()].copy()
-        
-        # Group by driver
-        pitstops_by_driver = {}
-        
-        for driver_code in pit_laps['Driver'].unique():
-            driver_pits = pit_laps[pit_laps['Driver'] == driver_code].sort_values('PitInTime')
-            
-            pit_stops = []
-            for _, lap in driver_pits.iterrows():
-                pit_stop = {
-                    "lap": int(lap['LapNumber']),
-                    "stint": int(lap['Stint']) if pd.notna(lap.get('Stint')) else None,
-                }
-                
-                if pd.notna(lap.get('PitInTime')):
-                    pit_stop["pit_in_time"] = lap['PitInTime'].total_seconds() if hasattr(lap['PitInTime'], 'total_seconds') else None
-                
-                if pd.notna(lap.get('PitOutTime')):
-                    pit_stop["pit_out_time"] = lap['PitOutTime'].total_seconds() if hasattr(lap['PitOutTime'], 'total_seconds') else None
-                
-                if pd.notna(lap.get('PitDuration')):
-                    pit_stop["pit_duration"] = lap['PitDuration'].total_seconds() if hasattr(lap['PitDuration'], 'total_seconds') else None
-                
-                if pd.notna(lap.get('LapTime')):
-                    pit_stop["lap_time"] = lap['LapTime'].total_seconds()
-                
-                if pd.notna(lap.get('Compound')):
-                    pit_stop["compound_before"] = lap['Compound']
-                
-                if pd.notna(lap.get('TyreLife')):
-                    pit_stop["tyre_life_before"] = int(lap['TyreLife'])
-                
-                pit_stops.append(pit_stop)
-            
-            pitstops_by_driver[driver_code] = {
-                "driver": driver_code,
-                "total_stops": len(pit_stops),
-                "stops": pit_stops
-            }
-        
-        return {
-            "race": session_obj.event['EventName'],
-            "year": year,
-            "total_drivers": len(pitstops_by_driver),
-            "pitstops": pitstops_by_driver
-        }
+        payload = await _shared_payload(
+            f"pitstops:{year}:{race}:{session}", year, _pitstops_payload, year, race, session
+        )
+        return _cached_json_response(request, *payload, year)
         
-    except Exception as e:
-        logger.error("Failed to fetch pit stops", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Failed to fetch pit stops", year=year, race=race)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+# Lap columns needed to clean and serialize a driver's laps
+_LAP_COLUMNS = [
+    'LapNumber', 'LapTime', 'Sector1Time', 'Sector2Time', 'Sector3Time',
+    'Compound', 'TyreLife', 'IsAccurate', 'PitInTime', 'PitOutTime'
+]
+
+
+@lru_cache(maxsize=256)
+def _event_name(year: int, race: int) -> str:
+    """Event name for a round from the season schedule (no session load)"""
+    schedule = app.state.loader.get_race_schedule(year)
+    event = schedule[schedule['RoundNumber'] == race]
+    if event.empty:
+        raise HTTPException(status_code=404, detail="Race not found in schedule")
+    return str(event['EventName'].iloc[0])
 
 
 @app.get("/laps/{year}/{race}/{driver}")
-def get_driver_laps(
+async def get_driver_laps(
     year: int,
     race: int,
     driver: str,
@@ -422,74 +1448,57 @@ def get_driver_laps(
     try:
         logger.info("Fetching laps", year=year, race=race, driver=driver, session=session)
         
-        # Load session
-        session_obj = loader.load_session(year, race, session)
+        def build() -> pd.DataFrame:
+            # Get laps (uncleaned - contains pit stops); a laps snapshot hit
+            # never loads the session, so the name comes from the schedule
+            laps = get_cached_driver_laps(year, race, session, driver)
+            columns = dict.fromkeys((*_PIT_STOP_COLUMNS, *_LAP_COLUMNS))
+            laps = pd.DataFrame(laps[[column for column in columns if column in laps.columns]])
+            laps.attrs['EventName'] = _event_name(year, race)
+            return laps
         
-        # Get laps (uncleaned - contains pit stops)
-        laps_raw = loader.get_laps(session_obj, driver)
+        # Off the event loop: a cold session load blocks for seconds
+        laps_raw = await to_thread.run_sync(get_derived, year, race, f"laps_{session}_{driver}", build)
         
         # Extract pit stops from raw data BEFORE cleaning
-        pit_stops = []
-        for _, lap in laps_raw[laps_raw['PitInTime'].notna()].iterrows():
-            pit_stop = {
-                "lap": int(lap['LapNumber']),
-                "stint": int(lap['Stint']) if pd.notna(lap.get('Stint')) else None,
-                "pit_in_time": lap['PitInTime'].total_seconds() if hasattr(lap['PitInTime'], 'total_seconds') else None,
-            }
-            
-            # Add optional fields if available
-            if pd.notna(lap.get('PitOutTime')):
-                pit_stop["pit_out_time"] = lap['PitOutTime'].total_seconds() if hasattr(lap['PitOutTime'], 'total_seconds') else None
-            
-            if pd.notna(lap.get('PitDuration')):
-                pit_stop["pit_duration"] = lap['PitDuration'].total_seconds() if hasattr(lap['PitDuration'], 'total_seconds') else None
-            
-            if pd.notna(lap.get('LapTime')):
-                pit_stop["lap_time"] = lap['LapTime'].total_seconds()
-            
-            if pd.notna(lap.get('Compound')):
-                pit_stop["compound_before"] = lap['Compound']
-            
-            if pd.notna(lap.get('TyreLife')):
-                pit_stop["tyre_life_before"] = int(lap['TyreLife'])
-            
-            pit_stops.append(pit_stop)
-        
-        # Clean data for lap times (removes pit laps)
-        laps_clean = LapProcessor.clean_lap_times(laps_raw)
-        
-        # Convert to response format
-        lap_data = []
-        
-        for _, lap in laps_clean.iterrows():
-            # Collect lap data
-            lap_data.append({
-                "lap_number": int(lap['LapNumber']),
-                "time": lap['LapTime'].total_seconds() if pd.notna(lap['LapTime']) else None,
-                "sector1": lap['Sector1Time'].total_seconds() if pd.notna(lap['Sector1Time']) else None,
-                "sector2": lap['Sector2Time'].total_seconds() if pd.notna(lap['Sector2Time']) else None,
-                "sector3": lap['Sector3Time'].total_seconds() if pd.notna(lap['Sector3Time']) else None,
-                "compound": lap['Compound'],
-                "tyre_life": int(lap['TyreLife']) if pd.notna(lap['TyreLife']) else None,
-            })
+        pit_stops = _pit_stop_records(laps_raw[laps_raw['PitInTime'].notna()])
         
-        return {
+        # Clean data for lap times (removes pit laps) and convert to response
+        # format in Polars: one Arrow conversion, nulls preserved natively;
+        # durations cast to int nanoseconds so seconds match Timedelta.total_seconds
+        laps_clean = LapProcessor.clean_lap_times_pl(
+            pl.from_pandas(pd.DataFrame(laps_raw[_LAP_COLUMNS]))
+        )
+        lap_data = laps_clean.select(
+            pl.col('LapNumber').cast(pl.Int64).alias('lap_number'),
+            (pl.col('LapTime').cast(pl.Int64) / 1e9).alias('time'),
+            (pl.col('Sector1Time').cast(pl.Int64) / 1e9).alias('sector1'),
+            (pl.col('Sector2Time').cast(pl.Int64) / 1e9).alias('sector2'),
+            (pl.col('Sector3Time').cast(pl.Int64) / 1e9).alias('sector3'),
+            pl.col('Compound').alias('compound'),
+            pl.col('TyreLife').cast(pl.Int64).alias('tyre_life'),
+        ).to_dicts()
+        
+        return NumpyORJSONResponse({
             "driver": driver,
-            "race": session_obj.event['EventName'],
+            "race": laps_raw.attrs['EventName'],
             "laps": lap_data,
             "pit_stops": pit_stops
-        }
+        }, headers=_cache_headers(year))
     
-    except Exception as e:
-        logger.error("Failed to fetch laps", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Failed to fetch laps", year=year, race=race)
+        raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/sectors/{year}/{race}/{driver}")
-def get_sector_times(
+async def get_sector_times(
     year: int,
     race: int,
     driver: str,
+    response: Response,
     session: str = Query("R", description="Session type")
 ):
     """
@@ -507,28 +1516,31 @@ def get_sector_times(
     try:
         logger.info("Fetching sector times", year=year, race=race, driver=driver)
         
-        session_obj = loader.load_session(year, race, session)
-        laps = loader.get_laps(session_obj, driver)
-        laps_clean = LapProcessor.clean_lap_times(laps)
+        def build() -> pd.DataFrame:
+            return LapProcessor.aggregate_sector_times(_get_clean_laps(year, race, session, driver))
         
-        sectors = LapProcessor.aggregate_sector_times(laps_clean)
+        sectors = await to_thread.run_sync(get_derived, year, race, f"sectors_{session}_{driver}", build)
         
+        response.headers.update(_cache_headers(year))
         return {
             "driver": driver,
             "sectors": sectors.to_dict('records')
         }
     
-    except Exception as e:
-        logger.error("Failed to fetch sector times", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Failed to fetch sector times", year=year, race=race)
+        raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/comparison/{year}/{race}/{driver1}/{driver2}")
-def compare_drivers(
+async def compare_drivers(
     year: int,
     race: int,
     driver1: str,
     driver2: str,
+    response: Response,
     session: str = Query("R", description="Session type")
 ):
     """
@@ -547,28 +1559,31 @@ def compare_drivers(
     try:
         logger.info("Comparing drivers", year=year, race=race, driver1=driver1, driver2=driver2)
         
-        session_obj = loader.load_session(year, race, session)
-        
-        laps1 = loader.get_laps(session_obj, driver1)
-        laps2 = loader.get_laps(session_obj, driver2)
+        laps1_clean, laps2_clean = await asyncio.gather(
+            get_clean_laps_async(year, race, session, driver1),
+            get_clean_laps_async(year, race, session, driver2)
+        )
         
-        laps1_clean = LapProcessor.clean_lap_times(laps1)
-        laps2_clean = LapProcessor.clean_lap_times(laps2)
-        
-        comparison = ComparisonAnalyzer.compare_drivers(laps1_clean, laps2_clean)
+        comparison = await to_thread.run_sync(
+            ComparisonAnalyzer.compare_drivers, laps1_clean, laps2_clean
+        )
         
+        response.headers.update(_cache_headers(year))
         return comparison
     
-    except Exception as e:
-        logger.error("Failed to compare drivers", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Failed to compare drivers", year=year, race=race)
+        raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/analysis/pace/{year}/{race}/{driver}")
-def get_pace_analysis(
+async def get_pace_analysis(
     year: int,
     race: int,
     driver: str,
+    response: Response,
     session: str = Query("R", description="Session type")
 ):
     """
@@ -586,32 +1601,76 @@ def get_pace_analysis(
     try:
         logger.info("Analyzing pace", year=year, race=race, driver=driver)
         
-        session_obj = loader.load_session(year, race, session)
-        laps = loader.get_laps(session_obj, driver)
-        laps_clean = LapProcessor.clean_lap_times(laps)
+        laps_clean = await get_clean_laps_async(year, race, session, driver)
         
-        pace = LapAnalyzer.calculate_pace_analysis(laps_clean)
-        degradation = LapAnalyzer.analyze_tyre_degradation(laps_clean)
+        # Independent reductions over the same laps, run in parallel worker threads
+        pace, degradation = await asyncio.gather(
+            to_thread.run_sync(LapAnalyzer.calculate_pace_analysis, laps_clean),
+            to_thread.run_sync(LapAnalyzer.analyze_tyre_degradation, laps_clean)
+        )
         
+        response.headers.update(_cache_headers(year))
         return {
             "driver": driver,
             "pace": pace,
             "tyre_degradation": degradation.to_dict('records')
         }
     
-    except Exception as e:
-        logger.error("Failed to analyze pace", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Failed to analyze pace", year=year, race=race)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@_season_cache(maxsize=32)
+def _race_drivers_payload(year: int, race: int) -> tuple[bytes, str]:
+    """
+    Build driver metadata for a race in one pass over session.results
+    
+    Args:
+        year: Season year
+        race: Race round number
+    
+    Returns:
+        Tuple of (serialized /drivers body, ETag); drivers are sorted by number
+    """
+    session = get_cached_session(year, race, "R")
+    
+    # Only drivers that actually set laps in the session
+    drivers_list = []
+    if hasattr(session, 'laps') and not session.laps.empty:
+        results = session.results
+        results = results[results['Abbreviation'].isin(session.laps['Driver'].unique())]
+        
+        numbers = results['DriverNumber'].astype(str)
+        drivers = pd.DataFrame({
+            'code': results['Abbreviation'].to_numpy(),
+            'name': (results['FirstName'].astype(str) + ' ' + results['LastName'].astype(str)).to_numpy(),
+            'number': numbers.to_numpy()
+        })
+        
+        # Sort by driver number (non-numeric last), stable like list.sort
+        sort_keys = pd.to_numeric(numbers.where(numbers.str.isdigit()), errors='coerce').fillna(999)
+        order = np.argsort(sort_keys.to_numpy(), kind='stable')
+        drivers_list = drivers.iloc[order].to_dict('records')
+    
+    return _serialize({
+        "year": year,
+        "race": race,
+        "drivers": drivers_list
+    })
 
 
 @app.get("/drivers/{year}/{race}")
-def get_race_drivers(year: int, race: int):
+async def get_race_drivers(year: int, race: int, request: Request):
     """
     Get list of drivers who participated in a specific race
     
     Args:
         year: Season year
         race: Race round number
+        request: Incoming request (for If-None-Match)
     
     Returns:
         List of drivers with their codes and names
@@ -619,35 +1678,85 @@ def get_race_drivers(year: int, race: int):
     try:
         logger.info("Fetching drivers for race", year=year, race=race)
         
-        session = get_cached_session(year, race, "R")
-        
-        # Get unique drivers from the session
-        drivers_list = []
-        if hasattr(session, 'laps') and not session.laps.empty:
-            unique_drivers = session.laps['Driver'].unique()
-            
-            for driver_code in unique_drivers:
-                # Get driver info from session
-                driver_info = session.get_driver(driver_code)
-                if driver_info is not None and not driver_info.empty:
-                    drivers_list.append({
-                        'code': driver_code,
-                        'name': f"{driver_info['FirstName']} {driver_info['LastName']}",
-                        'number': str(driver_info['DriverNumber'])
-                    })
-        
-        # Sort by driver number
-        drivers_list.sort(key=lambda x: int(x['number']) if x['number'].isdigit() else 999)
-        
-        return {
-            "year": year,
-            "race": race,
-            "drivers": drivers_list
-        }
+        payload = await to_thread.run_sync(_race_drivers_payload, year, race)
+        return _cached_json_response(request, *payload, year)
     
-    except Exception as e:
-        logger.error("Failed to fetch drivers", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Failed to fetch drivers", year=year, race=race)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+async def _telemetry_payload(
+    year: int,
+    race: int,
+    driver1: str,
+    driver2: str,
+    session: str,
+    fmt: str
+) -> dict:
+    """Build the /telemetry response payload (see get_telemetry_comparison)"""
+    # Fastest laps and telemetry (memoized; blocking FastF1 work runs in worker threads)
+    (fastest1, tel1), (fastest2, tel2) = await asyncio.gather(
+        to_thread.run_sync(_fastest_telemetry, year, race, session, driver1),
+        to_thread.run_sync(_fastest_telemetry, year, race, session, driver2)
+    )
+    
+    if fastest1 is None or fastest2 is None:
+        raise HTTPException(status_code=404, detail="Could not find fastest laps for drivers")
+    
+    # Find minimum distance across both laps to normalize consistently
+    distance1 = tel1['Distance'].to_numpy()
+    distance2 = tel2['Distance'].to_numpy()
+    min_distance = min((d.min() for d in (distance1, distance2) if d.size), default=0.0)
+    
+    # Convert to dict with distance, speed, throttle, brake, gear, RPM, DRS
+    # (NumPy arrays are serialized directly by NumpyORJSONResponse)
+    tel1_data = {
+        'Distance': distance1 - min_distance,
+        'Speed': tel1['Speed'].to_numpy(),
+        'Throttle': tel1['Throttle'].to_numpy(),
+        'Brake': tel1['Brake'].to_numpy(),
+        'nGear': tel1['nGear'].to_numpy(),
+        'RPM': tel1['RPM'].to_numpy(),
+        'DRS': tel1['DRS'].to_numpy() if 'DRS' in tel1.columns else np.zeros(len(tel1), dtype=np.int64),
+    }
+    
+    tel2_data = {
+        'Distance': distance2 - min_distance,
+        'Speed': tel2['Speed'].to_numpy(),
+        'Throttle': tel2['Throttle'].to_numpy(),
+        'Brake': tel2['Brake'].to_numpy(),
+        'nGear': tel2['nGear'].to_numpy(),
+        'RPM': tel2['RPM'].to_numpy(),
+        'DRS': tel2['DRS'].to_numpy() if 'DRS' in tel2.columns else np.zeros(len(tel2), dtype=np.int64),
+    }
+    
+    if fmt == "base64":
+        tel1_data = _encode_arrays(tel1_data)
+        tel2_data = _encode_arrays(tel2_data)
+    else:
+        # Compact dtypes: shorter float32 repr and integer encoding in JSON
+        tel1_data = _downcast_arrays(tel1_data)
+        tel2_data = _downcast_arrays(tel2_data)
+    
+    return {
+        "driver1": driver1,
+        "driver2": driver2,
+        "lap1": {
+            "lap_time": str(fastest1['LapTime']),
+            "lap_number": int(fastest1['LapNumber']),
+            "compound": str(fastest1['Compound']),
+            "telemetry": tel1_data
+        },
+        "lap2": {
+            "lap_time": str(fastest2['LapTime']),
+            "lap_number": int(fastest2['LapNumber']),
+            "compound": str(fastest2['Compound']),
+            "telemetry": tel2_data
+        }
+    }
 
 
 @app.get("/telemetry/{year}/{race}/{driver1}/{driver2}")
@@ -656,7 +1765,11 @@ async def get_telemetry_comparison(
     race: int,
     driver1: str,
     driver2: str,
-    session: str = Query(default="R", description="Session type (R=Race, Q=Qualifying)")
+    session: str = Query(default="R", description="Session type (R=Race, Q=Qualifying)"),
+    fmt: str = Query(
+        default="json", alias="format", pattern="^(json|base64|arrow)$",
+        description="Channel encoding: JSON number lists, base64 typed arrays or an Arrow IPC stream"
+    )
 ):
     """
     Get detailed telemetry comparison between two drivers for their fastest laps
@@ -667,6 +1780,10 @@ async def get_telemetry_comparison(
         driver1: First driver code
         driver2: Second driver code
         session: Session type
+        fmt: "json" for number lists, "base64" for compact typed arrays
+            (float32, uint8/uint16 for integer channels) as {"dtype", "len", "data"},
+            "arrow" for an Arrow IPC stream (one row per sample, "Driver" column;
+            lap details as JSON in the "telemetry" schema metadata)
     
     Returns:
         Telemetry data for both drivers
@@ -674,78 +1791,102 @@ async def get_telemetry_comparison(
     try:
         logger.info("Getting telemetry comparison", year=year, race=race, driver1=driver1, driver2=driver2)
         
-        session_obj = get_cached_session(year, race, session)
+        # Identical concurrent requests share one computation
+        payload = await _single_flight(
+            f"tel:{year}:{race}:{driver1}:{driver2}:{session}:{fmt}",
+            lambda: _telemetry_payload(year, race, driver1, driver2, session, fmt)
+        )
         
-        # Get fastest laps for both drivers
-        fastest1 = loader.get_fastest_lap(session_obj, driver1)
-        fastest2 = loader.get_fastest_lap(session_obj, driver2)
-        
-        if fastest1 is None or fastest2 is None:
-            raise HTTPException(status_code=404, detail="Could not find fastest laps for drivers")
-        
-        # Get telemetry data
-        tel1 = fastest1.get_telemetry()
-        tel2 = fastest2.get_telemetry()
-        
-        # Find minimum distance across both laps to normalize consistently
-        all_distances = tel1['Distance'].tolist() + tel2['Distance'].tolist()
-        min_distance = min(all_distances) if all_distances else 0
-        
-        # Normalize distances to start from 0 using the same offset
-        def normalize_distance(distances):
-            return [d - min_distance for d in distances]
-        
-        # Convert to dict with distance, speed, throttle, brake, gear, RPM, DRS
-        tel1_data = {
-            'Distance': normalize_distance(tel1['Distance'].tolist()),
-            'Speed': tel1['Speed'].tolist(),
-            'Throttle': tel1['Throttle'].tolist(),
-            'Brake': tel1['Brake'].tolist(),
-            'nGear': tel1['nGear'].tolist(),
-            'RPM': tel1['RPM'].tolist(),
-            'DRS': tel1['DRS'].tolist() if 'DRS' in tel1.columns else [0] * len(tel1),
-        }
+        if fmt == "arrow":
+            return Response(
+                _telemetry_arrow(payload),
+                media_type=ARROW_STREAM_MEDIA_TYPE,
+                headers=_cache_headers(year)
+            )
         
-        tel2_data = {
-            'Distance': normalize_distance(tel2['Distance'].tolist()),
-            'Speed': tel2['Speed'].tolist(),
-            'Throttle': tel2['Throttle'].tolist(),
-            'Brake': tel2['Brake'].tolist(),
-            'nGear': tel2['nGear'].tolist(),
-            'RPM': tel2['RPM'].tolist(),
-            'DRS': tel2['DRS'].tolist() if 'DRS' in tel2.columns else [0] * len(tel2),
-        }
-        
-        return {
-            "driver1": driver1,
-            "driver2": driver2,
-            "lap1": {
-                "lap_time": str(fastest1['LapTime']),
-                "lap_number": int(fastest1['LapNumber']),
-                "compound": str(fastest1['Compound']),
-                "telemetry": tel1_data
-            },
-            "lap2": {
-                "lap_time": str(fastest2['LapTime']),
-                "lap_number": int(fastest2['LapNumber']),
-                "compound": str(fastest2['Compound']),
-                "telemetry": tel2_data
-            }
-        }
+        # Returned directly to skip jsonable_encoder on the NumPy payload
+        return NumpyORJSONResponse(payload, headers=_cache_headers(year))
     
-    except Exception as e:
-        logger.error("Failed to get telemetry comparison", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Failed to get telemetry comparison", year=year, race=race)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@lru_cache(maxsize=64)
+def _circuit_layout_payload(year: int, race: int, fmt: str) -> tuple[bytes, str]:
+    """Serialized circuit layout and ETag for a race (see get_circuit_layout)"""
+    # Geometry is fixed per venue and season: look the event up in the schedule
+    # and serve the cached arrays without loading the race session
+    schedule = app.state.loader.get_race_schedule(year)
+    event = schedule[schedule['RoundNumber'] == race]
+    if event.empty:
+        raise HTTPException(status_code=404, detail="Race not found in schedule")
+    circuit_name = event['EventName'].iloc[0]
+    location = str(event['Location'].iloc[0])
+    
+    layout_data = app.state.loader.load_circuit_layout(year, location)
+    if layout_data is None:
+        layout_data = _extract_circuit_layout(year, race)
+        app.state.loader.save_circuit_layout(year, location, layout_data)
+    
+    if fmt == "base64":
+        layout_data = _encode_arrays(layout_data)
+    else:
+        # float32 coordinates: sub-millimetre precision, far shorter JSON numbers
+        layout_data = _downcast_arrays(layout_data)
+    
+    return _serialize({
+        "circuit": circuit_name,
+        "layout": layout_data
+    })
+
+
+def _extract_circuit_layout(year: int, race: int) -> dict[str, np.ndarray]:
+    """X/Y/distance arrays from the race's fastest lap telemetry (full session load)"""
+    session = get_cached_session(year, race, "R")
+    
+    # Get a lap with telemetry data (includes proper X, Y coordinates)
+    laps = session.laps
+    if laps.empty:
+        raise HTTPException(status_code=404, detail="No laps found")
+    
+    # Get telemetry from fastest lap (has X, Y and Distance)
+    _, telemetry = _fastest_telemetry(year, race, "R", None)
+    
+    if telemetry is None or telemetry.empty or 'X' not in telemetry.columns or 'Y' not in telemetry.columns:
+        raise HTTPException(status_code=404, detail="No position data available")
+    
+    # Normalize distances to start from 0 (one vectorized reduction and subtraction)
+    distances = telemetry['Distance'].to_numpy()
+    min_distance = distances.min() if distances.size else 0.0
+    
+    return {
+        'x': telemetry['X'].to_numpy(),
+        'y': telemetry['Y'].to_numpy(),
+        'distance': distances - min_distance
+    }
 
 
 @app.get("/circuit-layout/{year}/{race}")
-def get_circuit_layout(year: int, race: int):
+async def get_circuit_layout(
+    year: int,
+    race: int,
+    request: Request,
+    fmt: str = Query(
+        default="json", alias="format", pattern="^(json|base64)$",
+        description="Coordinate encoding: JSON number lists or base64 float32 arrays"
+    )
+):
     """
     Get circuit layout coordinates for visualization
     
     Args:
         year: Season year
         race: Race round number
+        request: Incoming request (for If-None-Match)
+        fmt: "json" for number lists, "base64" for float32 typed arrays
     
     Returns:
         Circuit layout X/Y coordinates
@@ -753,45 +1894,35 @@ def get_circuit_layout(year: int, race: int):
     try:
         logger.info("Fetching circuit layout", year=year, race=race)
         
-        # Load race session
-        session = get_cached_session(year, race, "R")
-        
-        # Get a lap with telemetry data (includes proper X, Y coordinates)
-        laps = session.laps
-        if laps.empty:
-            raise HTTPException(status_code=404, detail="No laps found")
-        
-        # Get telemetry from fastest lap (has X, Y and Distance)
-        lap = laps.pick_fastest()
-        telemetry = lap.get_telemetry()
+        payload = await _shared_payload(
+            f"circuit-layout:{year}:{race}:{fmt}", year, _circuit_layout_payload, year, race, fmt
+        )
+        # Layouts never change: compress once instead of per response
+        return _cached_json_response(request, *payload, year, precompress=True)
         
-        if telemetry.empty or 'X' not in telemetry.columns or 'Y' not in telemetry.columns:
-            raise HTTPException(status_code=404, detail="No position data available")
-        
-        # Get distances and find minimum to normalize
-        distances = telemetry['Distance'].tolist()
-        min_distance = min(distances) if distances else 0
-        
-        # Normalize distances to start from 0
-        normalized_distances = [d - min_distance for d in distances]
-        
-        # Prepare layout data
-        layout_data = {
-            'x': telemetry['X'].tolist(),
-            'y': telemetry['Y'].tolist(),
-            'distance': normalized_distances
-        }
-        
-        return {
-            "circuit": session.event['EventName'],
-            "layout": layout_data
-        }
-        
-    except Exception as e:
-        logger.error("Failed to get circuit layout", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Failed to get circuit layout", year=year, race=race)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+# Worker processes for the __main__ entrypoint; pandas/NumPy work holds the
+# GIL, so throughput scales with processes, but each keeps its own session
+# LRU of full FastF1 sessions, so the default stays small
+API_WORKERS = int(os.getenv("API_WORKERS", min(4, os.cpu_count() or 1)))
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "src.api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=API_WORKERS,
+        # uvloop has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        limit_concurrency=200,
+        timeout_keep_alive=30
+    )
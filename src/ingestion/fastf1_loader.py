@@ -1,13 +1,28 @@
 """FastF1 data loader and caching"""
 
 import fastf1
+import numpy as np
+import os
+import re
+import time
+from itertools import chain
+from operator import attrgetter
 import structlog
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 import pandas as pd
 
+from src.models.data_models import Incident
+
 logger = structlog.get_logger()
 
+# Low-cardinality string lap columns, stored as categoricals (int codes)
+_CATEGORICAL_LAP_COLUMNS = ('Driver', 'Team', 'Compound')
+
+# Derived cache entry names end up in file paths
+_DERIVED_NAME = re.compile(r'^[A-Za-z0-9_-]+$')
+_UNSAFE_PATH_CHARS = re.compile(r'[^\w-]+')
+
 
 class F1DataLoader:
     """Handles loading F1 data from FastF1 API"""
@@ -40,6 +55,7 @@ class F1DataLoader:
         try:
             session_obj = fastf1.get_session(year, race, session)
             session_obj.load()
+            self.categorize_laps(session_obj.laps)
             logger.info(
                 "Session loaded successfully",
                 event_name=session_obj.event['EventName'],
@@ -50,6 +66,231 @@ class F1DataLoader:
             logger.error("Failed to load session", err=str(e))
             raise
 
+    @staticmethod
+    def categorize_laps(laps: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert Driver/Team/Compound to categoricals in place
+        
+        Grouping, isin and equality masks then run on small integer codes
+        instead of hashing Python strings; Parquet snapshots keep the dtype.
+        
+        Args:
+            laps: Session lap data
+        
+        Returns:
+            The same DataFrame
+        """
+        with pd.option_context('mode.chained_assignment', None):
+            for column in _CATEGORICAL_LAP_COLUMNS:
+                if column in laps.columns and not isinstance(laps[column].dtype, pd.CategoricalDtype):
+                    laps[column] = laps[column].astype('category')
+        return laps
+
+    def laps_snapshot_path(self, year: int, race: int | str, session: str) -> Path:
+        """Path of the Parquet laps snapshot for a session"""
+        return self.cache_dir / "laps" / f"{year}_{race}_{session}.parquet"
+
+    def load_laps_snapshot(
+        self,
+        year: int,
+        race: int | str,
+        session: str = "R",
+        max_age: Optional[float] = None
+    ) -> Optional[fastf1.core.Laps]:
+        """
+        Load session laps from the Parquet snapshot, skipping a full session load
+        
+        Snapshots live on disk, so they are shared by all worker processes
+        and survive restarts.
+        
+        Args:
+            year: Season year
+            race: Race number or name
+            session: Session type (FP1, FP2, FP3, Q, S, R)
+            max_age: Treat snapshots older than this many seconds as missing
+                (None = never expires, for finished races)
+        
+        Returns:
+            Laps without session backing (no telemetry), or None if not cached
+        """
+        path = self.laps_snapshot_path(year, race, session)
+        if not self._is_fresh(path, max_age):
+            return None
+        
+        try:
+            laps = fastf1.core.Laps(pd.read_parquet(path, engine='pyarrow'))
+            logger.info("Loaded laps snapshot", path=str(path), lap_count=len(laps))
+            return laps
+        except Exception as e:
+            logger.warning("Failed to read laps snapshot", path=str(path), err=str(e))
+            return None
+
+    def save_laps_snapshot(
+        self,
+        year: int,
+        race: int | str,
+        session: str,
+        laps: pd.DataFrame,
+        max_age: Optional[float] = None
+    ) -> None:
+        """
+        Write session laps to a Parquet snapshot (no-op if a fresh one exists)
+        
+        Args:
+            year: Season year
+            race: Race number or name
+            session: Session type (FP1, FP2, FP3, Q, S, R)
+            laps: Session lap data
+            max_age: Overwrite snapshots older than this many seconds
+                (None = keep any existing snapshot)
+        """
+        path = self.laps_snapshot_path(year, race, session)
+        if self._is_fresh(path, max_age):
+            return
+        
+        self._write_parquet(path, laps)
+
+    def derived_path(self, year: int, race: int | str, name: str) -> Path:
+        """Path of a derived (processed) DataFrame in the disk cache"""
+        return self.cache_dir / "derived" / str(year) / str(race) / f"{name}.parquet"
+
+    def load_derived(
+        self,
+        year: int,
+        race: int | str,
+        name: str,
+        columns: Optional[list[str]] = None,
+        max_age: Optional[float] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Load a processed DataFrame saved by save_derived
+        
+        Args:
+            year: Season year
+            race: Race number or name
+            name: Cache entry name (letters, digits, '_' and '-')
+            columns: Only read these columns
+            max_age: Treat entries older than this many seconds as missing
+                (None = never expires, for finished races)
+        
+        Returns:
+            Cached DataFrame (with its attrs), or None on a miss
+        """
+        if not _DERIVED_NAME.match(name):
+            return None
+        
+        path = self.derived_path(year, race, name)
+        try:
+            if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+                return None
+            return pd.read_parquet(path, engine='pyarrow', columns=columns)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Failed to read derived cache", path=str(path), err=str(e))
+            return None
+
+    def save_derived(
+        self,
+        year: int,
+        race: int | str,
+        name: str,
+        frame: pd.DataFrame
+    ) -> None:
+        """
+        Save a processed DataFrame to the disk cache (overwrites)
+        
+        Args:
+            year: Season year
+            race: Race number or name
+            name: Cache entry name (letters, digits, '_' and '-')
+            frame: Data to persist; frame.attrs are stored alongside
+        """
+        if _DERIVED_NAME.match(name):
+            self._write_parquet(self.derived_path(year, race, name), frame)
+
+    def circuit_layout_path(self, year: int, location: str) -> Path:
+        """Path of the cached circuit geometry for a season's venue"""
+        slug = _UNSAFE_PATH_CHARS.sub('_', location).strip('_') or 'unknown'
+        return self.cache_dir / "layouts" / f"{year}_{slug}.npz"
+
+    def load_circuit_layout(self, year: int, location: str) -> Optional[dict[str, np.ndarray]]:
+        """
+        Load cached circuit geometry, skipping the session and telemetry load
+        
+        Args:
+            year: Season year (layouts change between seasons)
+            location: Event location from the schedule (e.g. "Sakhir")
+        
+        Returns:
+            Dict with 'x', 'y' and 'distance' arrays, or None if not cached
+        """
+        path = self.circuit_layout_path(year, location)
+        try:
+            with np.load(path) as layout:
+                return {name: layout[name] for name in ('x', 'y', 'distance')}
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Failed to read circuit layout", path=str(path), err=str(e))
+            return None
+
+    def save_circuit_layout(
+        self,
+        year: int,
+        location: str,
+        layout: dict[str, np.ndarray]
+    ) -> None:
+        """
+        Cache circuit geometry permanently (compressed .npz, written atomically)
+        
+        Args:
+            year: Season year
+            location: Event location from the schedule
+            layout: Dict with 'x', 'y' and 'distance' arrays
+        """
+        path = self.circuit_layout_path(year, location)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.savez_compressed(f, x=layout['x'], y=layout['y'], distance=layout['distance'])
+            os.replace(tmp_path, path)
+            logger.info("Saved circuit layout", path=str(path), points=len(layout['x']))
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning("Failed to save circuit layout", path=str(path), err=str(e))
+
+    @staticmethod
+    def _is_fresh(path: Path, max_age: Optional[float]) -> bool:
+        """Whether a cache file exists and is at most max_age seconds old (None = any age)"""
+        try:
+            age = time.time() - path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return max_age is None or age <= max_age
+
+    @staticmethod
+    def _write_parquet(path: Path, frame: pd.DataFrame) -> None:
+        """
+        Write a DataFrame to Parquet atomically, logging (not raising) failures
+        
+        The file is written under a temporary name and renamed into place,
+        so concurrent workers never read a partial file.
+        """
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Plain DataFrame (Laps subclass metadata isn't serializable); keep attrs
+            table = pd.DataFrame(frame)
+            table.attrs = dict(frame.attrs)
+            table.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+            os.replace(tmp_path, path)
+            logger.info("Saved Parquet cache", path=str(path), rows=len(frame))
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning("Failed to save Parquet cache", path=str(path), err=str(e))
+
     def get_laps(
         self, 
         session: fastf1.core.Session,
@@ -143,114 +384,208 @@ class F1DataLoader:
     def get_safety_car_periods(
         self,
         session: fastf1.core.Session
-    ) -> list[dict]:
+    ) -> list[Incident]:
         """
         Get Safety Car, VSC and Red Flag periods from session
         
+        The session status and race control sources are read in turn;
+        the lap-time fallback only runs when they found nothing.
+        
         Args:
             session: FastF1 session object
         
         Returns:
-            List of dicts with SC/VSC/Red Flag periods
+            List of SC/VSC/Red Flag incidents (Incident.to_dict() for JSON)
+        
+        Raises:
+            Exception: If the sources cannot be read, so callers never
+                mistake (or cache) a failure for an incident-free race
         """
         logger.info("Extracting Safety Car and Red Flag periods")
         
-        try:
-            incidents = []
-            
-            # Method 1: Check session_status for Red Flags
-            if hasattr(session, 'session_status'):
-                try:
-                    session_status = session.session_status
-                    if session_status is not None and len(session_status) > 0:
-                        # Session status contains time and status
-                        # Status can be: 'Started', 'Aborted', 'Finished', etc.
-                        for idx, row in session_status.iterrows():
-                            status = row.get('Status', '')
-                            if 'Aborted' in str(status) or 'Red' in str(status):
-                                # Try to find which lap this corresponds to
-                                time = row.get('Time', None)
-                                if time is not None:
-                                    # Find closest lap
-                                    laps = session.laps
-                                    # This is approximate
-                                    incidents.append({
-                                        'type': 'Red Flag',
-                                        'reason': 'Session stopped',
-                                        'lap': None  # We'll try to determine this
-                                    })
-                except Exception as e:
-                    logger.warning("Could not parse session_status", err=str(e))
-            
-            # Method 2: Check race_control_messages for flags
-            if hasattr(session, 'race_control_messages'):
-                try:
-                    rc_messages = session.race_control_messages
-                    if rc_messages is not None and len(rc_messages) > 0:
-                        for idx, msg in rc_messages.iterrows():
-                            message_text = str(msg.get('Message', '')).upper()
-                            lap_num = msg.get('Lap', None)
-                            
-                            if 'RED FLAG' in message_text:
-                                incidents.append({
-                                    'lap': int(lap_num) if lap_num is not None else None,
-                                    'type': 'Red Flag',
-                                    'reason': msg.get('Message', 'Red flag shown')
-                                })
-                            elif 'SAFETY CAR' in message_text or 'SC DEPLOYED' in message_text:
-                                incidents.append({
-                                    'lap': int(lap_num) if lap_num is not None else None,
-                                    'type': 'Safety Car',
-                                    'reason': msg.get('Message', 'Safety Car deployed')
-                                })
-                            elif 'VIRTUAL SAFETY CAR' in message_text or 'VSC' in message_text:
-                                incidents.append({
-                                    'lap': int(lap_num) if lap_num is not None else None,
-                                    'type': 'VSC',
-                                    'reason': msg.get('Message', 'Virtual Safety Car')
-                                })
-                except Exception as e:
-                    logger.warning("Could not parse race_control_messages", err=str(e))
-            
-            # Method 3: Analyze lap times for anomalies (backup method)
-            laps = session.laps
-            if len(laps) > 0 and len(incidents) == 0:
-                for driver in laps['Driver'].unique():
-                    driver_laps = laps[laps['Driver'] == driver].copy()
-                    if len(driver_laps) > 3:
-                        driver_laps = driver_laps[driver_laps['LapTime'].notna()]
-                        if len(driver_laps) > 0:
-                            median_time = driver_laps['LapTime'].median()
-                            slow_laps = driver_laps[
-                                driver_laps['LapTime'] > median_time * 1.5
-                            ]
-                            
-                            for _, lap in slow_laps.iterrows():
-                                lap_num = lap['LapNumber']
-                                if not any(p.get('lap') == lap_num for p in incidents):
-                                    incidents.append({
-                                        'lap': int(lap_num),
-                                        'type': 'SC/VSC',
-                                        'reason': 'Significant lap time increase detected'
-                                    })
-            
-            # Remove duplicates and sort
-            seen = set()
-            unique_incidents = []
-            for incident in incidents:
-                key = (incident.get('lap'), incident.get('type'))
+        # Drop incidents without a lap and sort by lap
+        unique_incidents = sorted(
+            (incident for incident in self.iter_incidents(session) if incident.lap is not None),
+            key=attrgetter('lap')
+        )
+        
+        logger.info(f"Found {len(unique_incidents)} incident periods")
+        return unique_incidents
+
+    def iter_incidents(self, session: fastf1.core.Session) -> Iterator[Incident]:
+        """
+        Lazily yield Safety Car, VSC and Red Flag incidents from session
+        
+        Sources are read one after another and only as far as the caller
+        iterates, so existence checks such as
+        any(i.type == 'Red Flag' for i in loader.iter_incidents(session))
+        can stop early. Unlike get_safety_car_periods, incidents without a
+        lap are included and order is by source.
+        
+        Args:
+            session: FastF1 session object
+        
+        Yields:
+            First report of each (lap, type) incident
+        """
+        return self._unique_incidents(
+            chain.from_iterable(
+                source(session) for source in (self._status_incidents, self._rc_incidents)
+            ),
+            lambda: self._anomaly_incidents(session)
+        )
+
+    @staticmethod
+    def _unique_incidents(
+        incidents: Iterable[Incident],
+        fallback: Callable[[], Iterable[Incident]]
+    ) -> Iterator[Incident]:
+        """
+        Yield the first report of each (lap, type), in source order
+        
+        Args:
+            incidents: Incidents from the primary sources
+            fallback: Produces backup incidents, called only if there were none
+        
+        Yields:
+            Deduplicated incidents
+        """
+        seen: set[tuple] = set()
+        
+        def unseen(source: Iterable[Incident]) -> Iterator[Incident]:
+            for incident in source:
+                key = (incident.lap, incident.type)
                 if key not in seen:
                     seen.add(key)
-                    unique_incidents.append(incident)
-            
-            unique_incidents = sorted(
-                [i for i in unique_incidents if i.get('lap') is not None],
-                key=lambda x: x['lap']
-            )
-            
-            logger.info(f"Found {len(unique_incidents)} incident periods")
-            return unique_incidents
-            
-        except Exception as e:
-            logger.error("Failed to get incident periods", err=str(e))
+                    yield incident
+        
+        yield from unseen(incidents)
+        if not seen:
+            yield from unseen(fallback())
+
+    @staticmethod
+    def _status_incidents(session: fastf1.core.Session) -> list[Incident]:
+        """
+        Method 1: Red Flags from session_status
+        
+        Args:
+            session: FastF1 session object
+        
+        Returns:
+            List of incidents (lap unknown)
+        """
+        incidents = []
+        if hasattr(session, 'session_status'):
+            try:
+                session_status = session.session_status
+                if session_status is not None and len(session_status) > 0:
+                    # Session status contains time and status
+                    # Status can be: 'Started', 'Aborted', 'Finished', etc.
+                    # Plain tuples instead of a Series per row; without a
+                    # Time column no status can be placed in the race
+                    has_time = 'Time' in session_status.columns
+                    rows = session_status.reindex(columns=['Status', 'Time'])
+                    for status, time in rows.itertuples(index=False, name=None):
+                        if 'Aborted' in str(status) or 'Red' in str(status):
+                            # Try to find which lap this corresponds to
+                            if has_time and time is not None:
+                                # This is approximate
+                                incidents.append(Incident(
+                                    type='Red Flag',
+                                    reason='Session stopped',
+                                    lap=None  # We'll try to determine this
+                                ))
+            except Exception as e:
+                logger.warning("Could not parse session_status", err=str(e))
+        
+        return incidents
+
+    @staticmethod
+    def _rc_incidents(session: fastf1.core.Session) -> list[Incident]:
+        """
+        Method 2: Red Flag, Safety Car and VSC flags from race_control_messages
+        
+        Args:
+            session: FastF1 session object
+        
+        Returns:
+            List of incidents in message order
+        """
+        incidents = []
+        if hasattr(session, 'race_control_messages'):
+            try:
+                rc_messages = session.race_control_messages
+                if rc_messages is not None and len(rc_messages) > 0:
+                    messages = rc_messages.get('Message', pd.Series('', index=rc_messages.index))
+                    lap_nums = rc_messages.get('Lap', pd.Series(None, index=rc_messages.index, dtype=object))
+                    
+                    # Classify all messages at once; earlier categories take precedence
+                    text = messages.astype(str).str.upper()
+                    
+                    def contains(phrase: str) -> np.ndarray:
+                        return text.str.contains(phrase, regex=False).to_numpy()
+                    
+                    kinds = np.select(
+                        [
+                            contains('RED FLAG'),
+                            contains('SAFETY CAR') | contains('SC DEPLOYED'),
+                            contains('VIRTUAL SAFETY CAR') | contains('VSC'),
+                        ],
+                        ['Red Flag', 'Safety Car', 'VSC'],
+                        default=''
+                    )
+                    flagged = kinds != ''
+                    
+                    for kind, lap_num, message in zip(
+                        kinds[flagged], lap_nums[flagged], messages[flagged]
+                    ):
+                        incidents.append(Incident(
+                            lap=None if pd.isna(lap_num) else int(lap_num),
+                            type=str(kind),
+                            reason=message
+                        ))
+            except Exception as e:
+                logger.warning("Could not parse race_control_messages", err=str(e))
+        
+        return incidents
+
+    @staticmethod
+    def _anomaly_incidents(session: fastf1.core.Session) -> list[Incident]:
+        """
+        Method 3: laps 1.5x slower than the driver's median (backup method)
+        
+        Args:
+            session: FastF1 session object
+        
+        Returns:
+            List of incidents, one per slow lap number
+        """
+        laps = session.laps
+        if len(laps) == 0:
             return []
+        
+        # Per-driver medians broadcast by one groupby (drivers with more
+        # than 3 laps), instead of a mask and copy per driver
+        drivers = laps['Driver']
+        driver_rank = pd.factorize(drivers)[0]
+        timed_mask = (
+            (drivers.groupby(drivers, observed=True).transform('size') > 3).to_numpy()
+            & laps['LapTime'].notna().to_numpy()
+        )
+        timed = laps.loc[timed_mask, ['Driver', 'LapNumber', 'LapTime']]
+        median_time = timed.groupby('Driver', observed=True)['LapTime'].transform('median')
+        slow = (timed['LapTime'] > median_time * 1.5).to_numpy()
+        
+        # Drivers in order of first appearance, then lap order; the
+        # first report of a lap number wins
+        order = np.argsort(driver_rank[timed_mask][slow], kind='stable')
+        slow_lap_numbers = pd.unique(timed['LapNumber'].to_numpy()[slow][order])
+        
+        return [
+            Incident(
+                lap=int(lap_num),
+                type='SC/VSC',
+                reason='Significant lap time increase detected'
+            )
+            for lap_num in slow_lap_numbers
+        ]
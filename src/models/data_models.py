@@ -58,6 +58,18 @@ class RaceInfo:
     country: str
 
 
+@dataclass(slots=True)
+class Incident:
+    """Safety Car, VSC or Red Flag report"""
+    lap: Optional[int]
+    type: str
+    reason: str
+
+    def to_dict(self) -> dict:
+        """Plain dict for the JSON API layer"""
+        return {'lap': self.lap, 'type': self.type, 'reason': self.reason}
+
+
 @dataclass
 class DriverComparison:
     """Comparison between two drivers"""
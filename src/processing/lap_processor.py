@@ -2,12 +2,29 @@
 
 import pandas as pd
 import numpy as np
+import polars as pl
 import structlog
 from typing import Optional
 
 logger = structlog.get_logger()
 
 
+def timedelta_to_seconds(values: pd.Series | pd.DataFrame) -> np.ndarray:
+    """
+    Timedelta column(s) as float seconds in one NumPy divide
+    
+    Same values as .dt.total_seconds() (NaT -> NaN) without the
+    per-call pandas accessor dispatch.
+    
+    Args:
+        values: Timedelta Series, or DataFrame of Timedelta columns
+    
+    Returns:
+        float64 array of seconds (2-D for a DataFrame)
+    """
+    return values.to_numpy(dtype='timedelta64[ns]') / np.timedelta64(1, 's')
+
+
 class LapProcessor:
     """Process and clean lap data"""
 
@@ -24,15 +41,15 @@ class LapProcessor:
         """
         initial_count = len(laps)
         
-        # Remove laps with no time
-        laps = laps[laps['LapTime'].notna()].copy()
-        
-        # Remove in/out laps
-        laps = laps[laps['IsAccurate'] == True].copy()
-        
-        # Remove pit laps
-        laps = laps[laps['PitInTime'].isna()].copy()
-        laps = laps[laps['PitOutTime'].isna()].copy()
+        # One combined mask and a single copy instead of a copy per filter:
+        # timed laps, no in/out laps, no pit laps
+        keep = (
+            laps['LapTime'].notna()
+            & (laps['IsAccurate'] == True)
+            & laps['PitInTime'].isna()
+            & laps['PitOutTime'].isna()
+        )
+        laps = laps[keep].copy()
         
         logger.info(
             "Cleaned lap times",
@@ -43,6 +60,38 @@ class LapProcessor:
         
         return laps
 
+    @staticmethod
+    def clean_lap_times_pl(laps: pl.DataFrame) -> pl.DataFrame:
+        """
+        Remove invalid laps and outliers from Polars lap data
+        
+        Same rules as clean_lap_times, as one multi-threaded filter on the
+        Arrow columns (null IsAccurate counts as inaccurate).
+        
+        Args:
+            laps: Raw lap data (pl.from_pandas of FastF1 laps)
+        
+        Returns:
+            Cleaned lap data
+        """
+        initial_count = laps.height
+        
+        laps = laps.filter(
+            pl.col('LapTime').is_not_null()
+            & pl.col('IsAccurate').fill_null(False)
+            & pl.col('PitInTime').is_null()
+            & pl.col('PitOutTime').is_null()
+        )
+        
+        logger.info(
+            "Cleaned lap times",
+            initial=initial_count,
+            remaining=laps.height,
+            removed=initial_count - laps.height
+        )
+        
+        return laps
+
     @staticmethod
     def calculate_lap_deltas(
         laps1: pd.DataFrame,
@@ -58,18 +107,17 @@ class LapProcessor:
         Returns:
             DataFrame with lap-by-lap deltas
         """
-        # Ensure both have same lap numbers
-        common_laps = set(laps1['LapNumber']) & set(laps2['LapNumber'])
-        
-        laps1_filtered = laps1[laps1['LapNumber'].isin(common_laps)].sort_values('LapNumber').reset_index(drop=True)
-        laps2_filtered = laps2[laps2['LapNumber'].isin(common_laps)].sort_values('LapNumber').reset_index(drop=True)
+        # Inner join on lap number keeps only laps both drivers completed
+        merged = laps1[['LapNumber', 'LapTime']].merge(
+            laps2[['LapNumber', 'LapTime']], on='LapNumber', suffixes=('1', '2')
+        ).sort_values('LapNumber', kind='stable')
         
         deltas = pd.DataFrame({
-            'LapNumber': laps1_filtered['LapNumber'].values,
-            'Driver1': laps1_filtered['Driver'].iloc[0] if len(laps1_filtered) > 0 else '',
-            'Driver2': laps2_filtered['Driver'].iloc[0] if len(laps2_filtered) > 0 else '',
-            'Time1': laps1_filtered['LapTime'].dt.total_seconds().values,
-            'Time2': laps2_filtered['LapTime'].dt.total_seconds().values,
+            'LapNumber': merged['LapNumber'].to_numpy(),
+            'Driver1': laps1['Driver'].iloc[0] if len(merged) > 0 else '',
+            'Driver2': laps2['Driver'].iloc[0] if len(merged) > 0 else '',
+            'Time1': timedelta_to_seconds(merged['LapTime1']),
+            'Time2': timedelta_to_seconds(merged['LapTime2']),
         })
         
         deltas['Delta'] = deltas['Time1'] - deltas['Time2']
@@ -87,23 +135,22 @@ class LapProcessor:
         Returns:
             Aggregated sector statistics
         """
+        # One extraction of all three sectors as float seconds (NaT -> NaN)
+        times = timedelta_to_seconds(laps[['Sector1Time', 'Sector2Time', 'Sector3Time']])
+        
+        # NaN-skipping column reductions, NaN for sectors with no valid times
+        valid = ~np.isnan(times)
+        counts = valid.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.where(valid, times, 0.0).sum(axis=0) / counts
+        mins = np.where(valid, times, np.inf).min(axis=0, initial=np.inf)
+        maxs = np.where(valid, times, -np.inf).max(axis=0, initial=-np.inf)
+        
         sectors = pd.DataFrame({
             'Sector': [1, 2, 3],
-            'Mean': [
-                laps['Sector1Time'].dt.total_seconds().mean(),
-                laps['Sector2Time'].dt.total_seconds().mean(),
-                laps['Sector3Time'].dt.total_seconds().mean(),
-            ],
-            'Min': [
-                laps['Sector1Time'].dt.total_seconds().min(),
-                laps['Sector2Time'].dt.total_seconds().min(),
-                laps['Sector3Time'].dt.total_seconds().min(),
-            ],
-            'Max': [
-                laps['Sector1Time'].dt.total_seconds().max(),
-                laps['Sector2Time'].dt.total_seconds().max(),
-                laps['Sector3Time'].dt.total_seconds().max(),
-            ]
+            'Mean': means,
+            'Min': np.where(counts > 0, mins, np.nan),
+            'Max': np.where(counts > 0, maxs, np.nan),
         })
         
         return sectors
@@ -130,7 +177,18 @@ class TelemetryProcessor:
         if 'Time' in telemetry.columns:
             telemetry = telemetry.set_index('Time')
         
-        resampled = telemetry.resample(frequency).interpolate(method='linear')
+        # Only numeric channels are interpolated; discrete ones (Brake, flags,
+        # strings) hold their last sample instead of being promoted to object
+        numeric_cols = telemetry.select_dtypes(include=np.number).columns
+        discrete_cols = telemetry.columns.difference(numeric_cols, sort=False)
+        
+        resampled = pd.concat(
+            [
+                telemetry[numeric_cols].resample(frequency).asfreq().interpolate(method='linear'),
+                telemetry[discrete_cols].resample(frequency).ffill(),
+            ],
+            axis=1
+        )[telemetry.columns]
         
         return resampled.reset_index()
 
@@ -145,14 +203,19 @@ class TelemetryProcessor:
         Returns:
             Speed trace with distance bins
         """
-        # Create distance bins (every 100m)
-        telemetry['DistanceBin'] = (telemetry['Distance'] // 100) * 100
+        # Group on compact int32 bin codes (every 100m) rather than a float key
+        # column added to the caller's frame; samples without a distance are skipped
+        distance = telemetry['Distance'].to_numpy(dtype=float)
+        has_distance = ~np.isnan(distance)
+        bins = (distance[has_distance] // 100).astype(np.int32)
         
-        speed_trace = telemetry.groupby('DistanceBin').agg({
+        speed_trace = telemetry.loc[has_distance, ['Speed', 'Throttle', 'Brake']].groupby(bins).agg({
             'Speed': ['mean', 'max', 'min'],
             'Throttle': 'mean',
             'Brake': 'mean'
-        }).reset_index()
+        })
+        speed_trace.index = pd.Index(speed_trace.index.to_numpy() * 100.0, name='DistanceBin')
+        speed_trace = speed_trace.reset_index()
         
         return speed_trace
 
@@ -168,17 +231,20 @@ class TelemetryProcessor:
         Returns:
             List of (start_distance, end_distance) tuples
         """
-        corners = []
-        in_corner = False
-        corner_start = 0
-        
-        for idx, row in telemetry.iterrows():
-            if row['Speed'] < threshold and not in_corner:
-                in_corner = True
-                corner_start = row['Distance']
-            elif row['Speed'] >= threshold and in_corner:
-                in_corner = False
-                corners.append((corner_start, row['Distance']))
+        speed = telemetry['Speed'].to_numpy(dtype=float)
+        distance = telemetry['Distance'].to_numpy()
+        
+        # Samples without a speed neither start nor end a corner
+        has_speed = ~np.isnan(speed)
+        below = speed[has_speed] < threshold
+        distance = distance[has_speed]
+        
+        # A corner starts where speed drops below the threshold and ends at the
+        # first sample back above it; a corner still open at the end is dropped
+        edges = np.diff(below.astype(np.int8), prepend=np.int8(0))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        corners = list(zip(distance[starts].tolist(), distance[ends].tolist()))
         
         logger.info("Detected corners", count=len(corners))
         
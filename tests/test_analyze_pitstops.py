@@ -0,0 +1,29 @@
+"""Test pit stop analysis script helpers"""
+
+import numpy as np
+import pandas as pd
+from scripts.analyze_pitstops import pit_stop_arrays
+
+
+def test_pit_stop_arrays_without_pit_duration():
+    """Test FastF1 laps without a PitDuration column still yield arrays and masks"""
+    pit_laps = pd.DataFrame({
+        'Driver': ['VER', 'HAM'],
+        'LapNumber': [15.0, 20.0],
+        'Stint': [1.0, np.nan],
+        'PitInTime': pd.to_timedelta([1800.0, 2100.0], unit='s'),
+        'PitOutTime': pd.to_timedelta([np.nan, 2125.0], unit='s'),
+        'Compound': ['MEDIUM', 'HARD'],
+        'TyreLife': [15.0, 20.0],
+        'LapTime': pd.to_timedelta([107.5, np.nan], unit='s'),
+    })
+    
+    arrays = pit_stop_arrays(pit_laps)
+    
+    assert np.isnan(arrays['durations']).all()
+    assert arrays['has_duration'].tolist() == [False, False]
+    assert arrays['has_pit_out'].tolist() == [False, True]
+    assert arrays['has_stint'].tolist() == [True, False]
+    assert arrays['stints'].tolist() == [1, 0]
+    assert arrays['lap_times'][0] == 107.5
+    assert arrays['lap_numbers'].tolist() == [15, 20]
@@ -0,0 +1,51 @@
+"""Test conditional and gzip-negotiated JSON responses"""
+
+import gzip
+
+from starlette.requests import Request
+from src.api.main import _accepts_gzip, _cached_json_response, _etag
+
+BODY = b'{"x": "' + b"a" * 2048 + b'"}'
+
+
+def _request(**headers) -> Request:
+    """Bare GET request with the given headers"""
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+def test_accepts_gzip_honours_q_values():
+    """Test q=0 refuses gzip and a wildcard accepts it"""
+    assert _accepts_gzip("gzip, deflate, br")
+    assert _accepts_gzip("br;q=1.0, gzip;q=0.5")
+    assert _accepts_gzip("*")
+    assert not _accepts_gzip("")
+    assert not _accepts_gzip("gzip;q=0, br")
+    assert not _accepts_gzip("*;q=0")
+    assert not _accepts_gzip("gzip;q=0, *")
+
+
+def test_gzip_representation_has_its_own_etag():
+    """Test gzip and identity bodies carry different strong ETags and 304 per representation"""
+    etag = _etag(BODY)
+    
+    plain = _cached_json_response(_request(accept_encoding="gzip;q=0"), BODY, etag, 2000)
+    zipped = _cached_json_response(_request(accept_encoding="gzip"), BODY, etag, 2000, precompress=True)
+    
+    assert plain.headers["etag"] == etag
+    assert "content-encoding" not in plain.headers
+    assert plain.body == BODY
+    assert zipped.headers["etag"] == f'{etag[:-1]}-gzip"'
+    assert zipped.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(zipped.body) == BODY
+    
+    # A validator only revalidates the representation it was issued for
+    assert _cached_json_response(
+        _request(accept_encoding="gzip", if_none_match=zipped.headers["etag"]), BODY, etag, 2000
+    ).status_code == 304
+    assert _cached_json_response(
+        _request(accept_encoding="identity", if_none_match=zipped.headers["etag"]), BODY, etag, 2000
+    ).status_code == 200
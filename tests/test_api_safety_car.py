@@ -0,0 +1,93 @@
+"""Test Safety Car period aggregation"""
+
+import random
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from src.api.main import _aggregate_safety_car_periods, _safety_car_payload, app
+
+
+def _aggregate_reference(sc_data):
+    """Message-by-message state machine the vectorized version must match"""
+    aggregated = []
+    current = None
+    for item in sc_data:
+        lap, sc_type, reason = item.get('lap'), item.get('type', ''), item.get('reason', '')
+        upper = reason.upper()
+        if 'CHEQUERED FLAG' in upper:
+            continue
+        if 'DEPLOYED' in upper:
+            if current is not None:
+                aggregated.append(current)
+            current = {'start_lap': lap, 'end_lap': lap, 'type': sc_type, 'reason': reason}
+        elif 'IN THIS LAP' in upper or 'ENDING' in upper:
+            if current is not None:
+                current['end_lap'] = lap
+                aggregated.append(current)
+                current = None
+            else:
+                aggregated.append({'start_lap': lap, 'end_lap': lap, 'type': sc_type, 'reason': reason})
+        elif current is not None:
+            current['end_lap'] = lap
+    if current is not None:
+        aggregated.append(current)
+    return aggregated
+
+
+def test_aggregate_safety_car_periods():
+    """Test deployment/ending messages merge into periods"""
+    sc_data = [
+        {'lap': 3, 'type': 'SC', 'reason': 'SAFETY CAR DEPLOYED'},
+        {'lap': 4, 'type': 'SC', 'reason': 'Track clear'},
+        {'lap': 5, 'type': 'SC', 'reason': 'SAFETY CAR IN THIS LAP'},
+        {'lap': 12, 'type': 'VSC', 'reason': 'VSC ENDING'},
+        {'lap': 20, 'type': 'VSC', 'reason': 'VIRTUAL SAFETY CAR DEPLOYED'},
+        {'lap': 58, 'type': 'FLAG', 'reason': 'CHEQUERED FLAG'},
+    ]
+    
+    assert _aggregate_safety_car_periods(sc_data) == [
+        {'start_lap': 3, 'end_lap': 5, 'type': 'SC', 'reason': 'SAFETY CAR DEPLOYED'},
+        {'start_lap': 12, 'end_lap': 12, 'type': 'VSC', 'reason': 'VSC ENDING'},
+        {'start_lap': 20, 'end_lap': 20, 'type': 'VSC', 'reason': 'VIRTUAL SAFETY CAR DEPLOYED'},
+    ]
+    assert _aggregate_safety_car_periods([]) == []
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_aggregate_safety_car_periods_matches_state_machine(seed):
+    """Test vectorized aggregation against the sequential state machine"""
+    rng = random.Random(seed)
+    reasons = [
+        'SAFETY CAR DEPLOYED', 'VSC DEPLOYED', 'SAFETY CAR IN THIS LAP',
+        'VSC ENDING', 'RED FLAG', 'TRACK CLEAR', 'CHEQUERED FLAG',
+    ]
+    sc_data = [
+        {'lap': lap, 'type': rng.choice(['SC', 'VSC', 'RED']), 'reason': rng.choice(reasons)}
+        for lap in sorted(rng.sample(range(1, 70), rng.randint(0, 15)))
+    ]
+    
+    assert _aggregate_safety_car_periods(sc_data) == _aggregate_reference(sc_data)
+
+
+def test_safety_car_failure_is_not_cached():
+    """Test a failed incident scan raises instead of persisting an empty result"""
+    loader = Mock()
+    loader.load_derived.return_value = None
+    loader.get_safety_car_periods.side_effect = RuntimeError("parse error")
+    
+    with patch.object(app.state, 'loader', loader), \
+            patch('src.api.main.get_cached_session', return_value=Mock()):
+        with pytest.raises(RuntimeError):
+            _safety_car_payload(2023, 1)
+    
+    loader.save_derived.assert_not_called()
+
+
+def test_safety_car_error_body_is_generic():
+    """Test a 500 response does not leak the exception text"""
+    with patch('src.api.main._shared_payload', side_effect=RuntimeError("secret path /srv/cache")):
+        response = TestClient(app).get("/safety-car/2023/1")
+    
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal server error"}
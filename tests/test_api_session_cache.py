@@ -0,0 +1,133 @@
+"""Test the API session LRU cache and its per-session memos"""
+
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from src.api import main
+
+
+@pytest.fixture
+def loader():
+    """Fresh session cache backed by a loader that never touches FastF1"""
+    fake = Mock()
+    fake.load_session.side_effect = lambda year, race, session: Mock(name=f"{year}_{race}_{session}")
+    with patch.object(main.app.state, 'loader', fake), patch.object(main, 'SESSION_CACHE_SIZE', 2):
+        main._session_cache.clear()
+        main._session_memos.clear()
+        main._session_loaded_at.clear()
+        yield fake
+        main._session_cache.clear()
+        main._session_memos.clear()
+        main._session_loaded_at.clear()
+
+
+def test_eviction_drops_only_the_evicted_sessions_memos(loader):
+    """Test memos outlive unrelated evictions and load locks are released"""
+    calls = []
+    
+    @main._session_memo
+    def memoized(year, race, session_type, driver):
+        calls.append((race, driver))
+        return main.get_cached_session(year, race, session_type)
+    
+    @main._session_memo
+    def other(year, race, session_type, driver):
+        return "other"
+    
+    memoized(2023, 1, "R", "VER")
+    memoized(2023, 2, "R", "VER")
+    memoized(2023, 2, "R", "VER")
+    assert calls == [(1, "VER"), (2, "VER")]
+    assert other(2023, 2, "R", "VER") == "other"
+    
+    # Loading a third session evicts round 1 only
+    main.get_cached_session(2023, 3, "R")
+    assert set(main._session_memos) == {"2023_2_R"}
+    
+    memoized(2023, 2, "R", "VER")
+    memoized(2023, 1, "R", "VER")
+    assert calls == [(1, "VER"), (2, "VER"), (1, "VER")]
+    assert main._session_load_locks == {}
+
+
+def test_season_cache_expires_live_season_payloads():
+    """Test past-season payloads stay memoized while live ones follow the Redis TTL"""
+    calls = []
+    
+    @main._season_cache(maxsize=4)
+    def payload(year, race):
+        calls.append(year)
+        return len(calls)
+    
+    live_year = main.datetime.now(main.timezone.utc).year
+    assert payload(2000, 1) == payload(2000, 1) == 1
+    assert payload(live_year, 1) == payload(live_year, 1) == 2
+    
+    with patch.object(main, '_payload_ttl', return_value=0):
+        payload(live_year, 2)
+        payload(live_year, 2)
+    assert calls == [2000, live_year, live_year, live_year]
+    assert payload.uncached(2000, 1) == 5
+
+
+def test_sessions_cached_mid_race_are_evicted(loader):
+    """Test race end times come from the race session and stale sessions are dropped"""
+    schedule = pd.DataFrame({
+        'RoundNumber': [1, 2],
+        'EventDate': pd.to_datetime(['2023-03-05', '2023-03-19']),
+        'Session5': ['Race', 'Race'],
+        'Session5DateUtc': pd.to_datetime(['2023-03-05 15:00', '2023-03-19 17:00']),
+    })
+    race_ends = main._race_end_times(schedule)
+    assert race_ends[1] == pd.Timestamp('2023-03-05 19:00', tz='UTC')
+    
+    main.get_cached_session(2023, 1, "R")
+    main.get_cached_session(2023, 2, "R")
+    # Round 1 was loaded during the race, round 2 after it finished
+    main._session_loaded_at["2023_1_R"] = pd.Timestamp('2023-03-05 16:00', tz='UTC')
+    main._session_loaded_at["2023_2_R"] = pd.Timestamp('2023-03-20 09:00', tz='UTC')
+    
+    main._evict_unfinished_sessions(2023, race_ends)
+    
+    assert list(main._session_cache) == ["2023_2_R"]
+
+
+def test_only_one_worker_takes_the_warm_up_lock(tmp_path):
+    """Test a second lock holder is refused while the first keeps the lock"""
+    fake = Mock(cache_dir=tmp_path)
+    with patch.object(main.app.state, 'loader', fake), patch.object(main, '_warm_lock_file', None):
+        assert main._acquire_warm_lock()
+        held = main._warm_lock_file
+        # A second open file description stands in for another worker process
+        main._warm_lock_file = None
+        assert not main._acquire_warm_lock()
+        held.close()
+        assert main._acquire_warm_lock()
+        main._warm_lock_file.close()
+
+
+def test_laps_snapshot_hit_never_loads_the_session(loader):
+    """Test /laps takes the event name from the schedule, not the session"""
+    laps = pd.DataFrame({
+        'Driver': ['VER', 'VER'], 'LapNumber': [1.0, 2.0], 'Stint': [1.0, 1.0],
+        'LapTime': pd.to_timedelta([92.0, 91.5], unit='s'),
+        'Sector1Time': pd.to_timedelta([30.0, 30.0], unit='s'),
+        'Sector2Time': pd.to_timedelta([31.0, 31.0], unit='s'),
+        'Sector3Time': pd.to_timedelta([31.0, 30.5], unit='s'),
+        'PitInTime': pd.to_timedelta([None, None]), 'PitOutTime': pd.to_timedelta([None, None]),
+        'PitDuration': pd.to_timedelta([None, None]),
+        'Compound': ['SOFT', 'SOFT'], 'TyreLife': [1.0, 2.0], 'IsAccurate': [True, True],
+    })
+    loader.load_derived.return_value = None
+    loader.load_laps_snapshot.return_value = laps
+    loader.get_race_schedule.return_value = pd.DataFrame({'RoundNumber': [1], 'EventName': ['Bahrain Grand Prix']})
+    main._event_name.cache_clear()
+    
+    response = TestClient(main.app).get("/laps/2023/1/VER")
+    
+    assert response.status_code == 200
+    assert response.json()['race'] == "Bahrain Grand Prix"
+    loader.load_session.assert_not_called()
+    main._event_name.cache_clear()
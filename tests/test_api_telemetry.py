@@ -0,0 +1,40 @@
+"""Tests for telemetry response encodings"""
+
+import numpy as np
+import orjson
+import pyarrow as pa
+from src.api.main import _downcast_arrays, _telemetry_arrow
+
+
+def _lap(n: int, lap_number: int) -> dict:
+    return {
+        "lap_time": "0 days 00:01:30.500000",
+        "lap_number": lap_number,
+        "compound": "SOFT",
+        "telemetry": _downcast_arrays({
+            "Distance": np.linspace(0.0, 5000.0, n),
+            "Speed": np.full(n, 300.4),
+            "Throttle": np.full(n, 99.6),
+            "Brake": np.zeros(n, dtype=bool),
+            "nGear": np.full(n, 8.0),
+            "RPM": np.full(n, 11800.0),
+            "DRS": np.zeros(n, dtype=np.int64),
+        }),
+    }
+
+
+def test_telemetry_arrow_stream():
+    """Test both laps are encoded into one typed Arrow table with lap metadata"""
+    payload = {"driver1": "VER", "driver2": "HAM", "lap1": _lap(3, 20), "lap2": _lap(2, 21)}
+    
+    table = pa.ipc.open_stream(_telemetry_arrow(payload)).read_all()
+    
+    assert table.column("Driver").to_pylist() == ["VER"] * 3 + ["HAM"] * 2
+    assert table.schema.field("Speed").type == pa.float32()
+    assert table.schema.field("nGear").type == pa.uint8()
+    assert table.column("RPM").to_pylist() == [11800] * 5
+    
+    metadata = orjson.loads(table.schema.metadata[b"telemetry"])
+    assert metadata["lap2"] == {
+        "lap_time": "0 days 00:01:30.500000", "lap_number": 21, "compound": "SOFT"
+    }
@@ -1,5 +1,6 @@
 """Test FastF1 data loader"""
 
+import pandas as pd
 import pytest
 from unittest.mock import Mock, patch
 from src.ingestion.fastf1_loader import F1DataLoader
@@ -39,3 +40,87 @@ def test_get_race_schedule(mock_fastf1, loader):
     
     mock_fastf1.get_event_schedule.assert_called_once_with(2024)
     assert result == mock_schedule
+
+
+def test_laps_snapshot_roundtrip(tmp_path):
+    """Test laps snapshot is read back without a session and refreshed when stale"""
+    snapshot_loader = F1DataLoader(cache_dir=str(tmp_path))
+    laps = pd.DataFrame({
+        'Driver': ['VER', 'HAM'],
+        'DriverNumber': ['1', '44'],
+        'LapNumber': [1.0, 1.0],
+        'LapTime': pd.to_timedelta([92.5, 93.1], unit='s'),
+    })
+    
+    assert snapshot_loader.load_laps_snapshot(2024, 1, "R") is None
+    
+    snapshot_loader.save_laps_snapshot(2024, 1, "R", laps)
+    result = snapshot_loader.load_laps_snapshot(2024, 1, "R")
+    
+    pd.testing.assert_frame_equal(pd.DataFrame(result), laps)
+    assert result.pick_driver('HAM')['LapTime'].iloc[0] == pd.Timedelta(seconds=93.1)
+    
+    # An existing snapshot is kept unless it is older than max_age
+    snapshot_loader.save_laps_snapshot(2024, 1, "R", laps.iloc[:1])
+    assert len(snapshot_loader.load_laps_snapshot(2024, 1, "R")) == 2
+    assert snapshot_loader.load_laps_snapshot(2024, 1, "R", max_age=-1) is None
+    
+    snapshot_loader.save_laps_snapshot(2024, 1, "R", laps.iloc[:1], max_age=-1)
+    assert len(snapshot_loader.load_laps_snapshot(2024, 1, "R")) == 1
+
+
+def test_derived_cache_roundtrip(tmp_path):
+    """Test derived frames keep attrs, expire by age and reject unsafe names"""
+    derived_loader = F1DataLoader(cache_dir=str(tmp_path))
+    sectors = pd.DataFrame({'Sector': [1, 2, 3], 'Mean': [28.1, 35.2, 29.2]})
+    sectors.attrs['EventName'] = 'Bahrain Grand Prix'
+    
+    derived_loader.save_derived(2024, 1, "sectors_R_VER", sectors)
+    result = derived_loader.load_derived(2024, 1, "sectors_R_VER")
+    
+    pd.testing.assert_frame_equal(result, sectors)
+    assert result.attrs['EventName'] == 'Bahrain Grand Prix'
+    assert derived_loader.load_derived(2024, 1, "sectors_R_VER", max_age=-1) is None
+    assert derived_loader.load_derived(2024, 1, "sectors_R_HAM") is None
+    
+    derived_loader.save_derived(2024, 1, "../escape", sectors)
+    assert not (tmp_path / "derived" / "2024" / "escape.parquet").exists()
+
+
+def test_safety_car_periods_from_slow_laps(loader):
+    """Test the lap-time fallback flags laps 1.5x slower than the driver's median"""
+    laps = pd.DataFrame({
+        'Driver': ['VER'] * 5 + ['HAM'] * 5 + ['LEC'] * 3,
+        'LapNumber': [1.0, 2.0, 3.0, 4.0, 5.0] * 2 + [1.0, 2.0, 3.0],
+        'LapTime': pd.to_timedelta(
+            [90, 91, 140, 90, None, 92, 93, 150, 92, 160, 90, 200, 90], unit='s'
+        ),
+    })
+    session = Mock(spec=['laps'], laps=laps)
+    
+    periods = loader.get_safety_car_periods(session)
+    
+    # LEC has too few laps to judge; lap 3 is reported once
+    assert [p.lap for p in periods] == [3, 5]
+    assert {p.type for p in periods} == {'SC/VSC'}
+    assert periods[0].to_dict() == {
+        'lap': 3, 'type': 'SC/VSC', 'reason': 'Significant lap time increase detected'
+    }
+
+
+def test_iter_incidents_deduplicates_lazily(loader):
+    """Test incidents dedupe in source order and skip the lap-time fallback"""
+    rc_messages = pd.DataFrame({
+        'Message': ['SAFETY CAR DEPLOYED', 'RED FLAG', 'SAFETY CAR IN THIS LAP', 'TRACK CLEAR'],
+        'Lap': [4.0, 6.0, 4.0, 7.0],
+    })
+    # No laps attribute: the lap-time fallback would raise if it ran
+    session = Mock(spec=['race_control_messages'], race_control_messages=rc_messages)
+    
+    incidents = list(loader.iter_incidents(session))
+    
+    assert [(i.lap, i.type) for i in incidents] == [(4, 'Safety Car'), (6, 'Red Flag')]
+    assert any(i.type == 'Red Flag' for i in loader.iter_incidents(session))
+    assert [(i.lap, i.type) for i in loader.get_safety_car_periods(session)] == [
+        (4, 'Safety Car'), (6, 'Red Flag')
+    ]
@@ -0,0 +1,63 @@
+"""Test lap analytics"""
+
+import pandas as pd
+import pytest
+from src.analytics.lap_analyzer import ComparisonAnalyzer, LapAnalyzer
+
+
+def test_find_optimal_lap():
+    """Test the optimal lap sums best sectors and is NaT if a sector has no time"""
+    laps = pd.DataFrame({
+        'Sector1Time': pd.to_timedelta([28.5, 28.1], unit='s'),
+        'Sector2Time': pd.to_timedelta([35.0, 35.2], unit='s'),
+        'Sector3Time': pd.to_timedelta([30.4, 30.0], unit='s'),
+    })
+    
+    optimal = LapAnalyzer.find_optimal_lap(laps)
+    assert optimal['OptimalLapTime'] == pd.Timedelta(seconds=93.1)
+    
+    laps['Sector2Time'] = pd.to_timedelta([None, None])
+    optimal = LapAnalyzer.find_optimal_lap(laps)
+    assert pd.isna(optimal['OptimalLapTime'])
+    assert optimal['Sector1Time'] == pd.Timedelta(seconds=28.1)
+
+
+def test_compare_drivers_leaves_laps_unchanged():
+    """Test analyzers read cached seconds without adding columns to the input"""
+    def laps(driver, times, sector1):
+        return pd.DataFrame({
+            'Driver': driver,
+            'LapTime': pd.to_timedelta(times, unit='s'),
+            'Sector1Time': pd.to_timedelta(sector1, unit='s'),
+        })
+    
+    ver = laps('VER', [90.0, 91.0], [28.0, 28.4])
+    ham = laps('HAM', [90.5, 90.5], [28.5, 28.5])
+    columns = ver.columns.tolist()
+    
+    comparison = ComparisonAnalyzer.compare_drivers(ver, ham)
+    LapAnalyzer.calculate_pace_analysis(ver)
+    
+    assert ver.columns.tolist() == columns
+    assert comparison['avg_gap'] == pytest.approx(0.0)
+    assert comparison['driver1_faster_laps'] == 1
+    assert comparison['sector1_gap'] == pytest.approx(-0.3)
+    assert comparison['sector2_gap'] == 0.0
+
+
+def test_cached_seconds_follow_in_place_edits():
+    """Test writes to a time column invalidate the cached seconds and degradation"""
+    laps = pd.DataFrame({
+        'Compound': ['SOFT', 'SOFT'],
+        'LapTime': pd.to_timedelta([90.0, 91.0], unit='s'),
+    })
+    
+    assert LapAnalyzer.calculate_pace_analysis(laps)['fastest_lap'] == pytest.approx(90.0)
+    assert LapAnalyzer.analyze_tyre_degradation(laps)['AvgLapTime'].iloc[0] == pytest.approx(90.5)
+    
+    laps.loc[0, 'LapTime'] = pd.Timedelta(seconds=89.0)
+    assert LapAnalyzer.calculate_pace_analysis(laps)['fastest_lap'] == pytest.approx(89.0)
+    
+    laps['LapTime'] = pd.to_timedelta([92.0, 93.0], unit='s')
+    assert LapAnalyzer.calculate_pace_analysis(laps)['fastest_lap'] == pytest.approx(92.0)
+    assert LapAnalyzer.analyze_tyre_degradation(laps)['AvgLapTime'].iloc[0] == pytest.approx(92.5)
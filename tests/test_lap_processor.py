@@ -0,0 +1,112 @@
+"""Test lap processing utilities"""
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+from src.processing.lap_processor import LapProcessor, TelemetryProcessor
+
+
+def test_aggregate_sector_times():
+    """Test sector aggregation skips missing times"""
+    laps = pd.DataFrame({
+        'Sector1Time': pd.to_timedelta([28.1, 28.3, None], unit='s'),
+        'Sector2Time': pd.to_timedelta([35.0, None, 35.4], unit='s'),
+        'Sector3Time': pd.to_timedelta([None, None, None], unit='s'),
+    })
+    
+    sectors = LapProcessor.aggregate_sector_times(laps)
+    
+    assert sectors['Sector'].tolist() == [1, 2, 3]
+    assert sectors.loc[0, 'Mean'] == pytest.approx(28.2)
+    assert sectors.loc[0, 'Min'] == pytest.approx(28.1)
+    assert sectors.loc[1, 'Max'] == pytest.approx(35.4)
+    assert np.isnan(sectors.loc[2, ['Mean', 'Min', 'Max']].astype(float)).all()
+
+
+def test_clean_lap_times():
+    """Test cleaning drops untimed, inaccurate and pit laps"""
+    pit_time = pd.Timedelta(seconds=1800)
+    laps = pd.DataFrame({
+        'LapNumber': [1, 2, 3, 4, 5],
+        'LapTime': pd.to_timedelta([95.0, None, 92.0, 110.0, 91.5], unit='s'),
+        'IsAccurate': [True, True, False, True, True],
+        'PitInTime': [pd.NaT, pd.NaT, pd.NaT, pit_time, pd.NaT],
+        'PitOutTime': [pd.NaT, pd.NaT, pd.NaT, pd.NaT, pd.NaT],
+    })
+    
+    cleaned = LapProcessor.clean_lap_times(laps)
+    
+    assert cleaned['LapNumber'].tolist() == [1, 5]
+    cleaned['LapNumber'] = 0
+    assert laps['LapNumber'].tolist() == [1, 2, 3, 4, 5]
+    
+    cleaned_pl = LapProcessor.clean_lap_times_pl(pl.from_pandas(laps))
+    assert cleaned_pl['LapNumber'].to_list() == [1, 5]
+
+
+def test_detect_corners():
+    """Test corners span from dropping below the threshold to recovering above it"""
+    telemetry = pd.DataFrame({
+        'Distance': [0.0, 10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0],
+        'Speed': [250.0, 180.0, np.nan, 210.0, 200.0, 150.0, 205.0, 120.0],
+    })
+    
+    corners = TelemetryProcessor.detect_corners(telemetry, threshold=200)
+    
+    # Ends at the first sample >= threshold; the open corner at 70 m is dropped
+    assert corners == [(10.0, 30.0), (50.0, 60.0)]
+
+
+def test_calculate_lap_deltas():
+    """Test deltas cover only laps both drivers completed, in lap order"""
+    laps1 = pd.DataFrame({
+        'Driver': 'VER',
+        'LapNumber': [3.0, 1.0, 2.0],
+        'LapTime': pd.to_timedelta([91.0, 93.0, None], unit='s'),
+    })
+    laps2 = pd.DataFrame({
+        'Driver': 'HAM',
+        'LapNumber': [1.0, 2.0, 4.0],
+        'LapTime': pd.to_timedelta([92.5, 92.0, 90.0], unit='s'),
+    })
+    
+    deltas = LapProcessor.calculate_lap_deltas(laps1, laps2)
+    
+    assert deltas['LapNumber'].tolist() == [1.0, 2.0]
+    assert deltas['Driver1'].tolist() == ['VER', 'VER']
+    assert deltas['Delta'].iloc[0] == pytest.approx(0.5)
+    assert np.isnan(deltas['Delta'].iloc[1])
+
+
+def test_calculate_speed_trace():
+    """Test speed statistics are binned every 100 m"""
+    telemetry = pd.DataFrame({
+        'Distance': [0.0, 50.0, 120.0, 199.0, np.nan, 250.0],
+        'Speed': [300.0, 280.0, 150.0, 170.0, 999.0, 320.0],
+        'Throttle': [100.0, 100.0, 0.0, 40.0, 0.0, 100.0],
+        'Brake': [False, False, True, False, True, False],
+    })
+    
+    trace = TelemetryProcessor.calculate_speed_trace(telemetry)
+    
+    assert trace['DistanceBin'].tolist() == [0.0, 100.0, 200.0]
+    assert trace[('Speed', 'mean')].tolist() == [290.0, 160.0, 320.0]
+    assert trace[('Speed', 'min')].tolist() == [280.0, 150.0, 320.0]
+    assert trace[('Brake', 'mean')].tolist() == [0.0, 0.5, 0.0]
+
+
+def test_resample_telemetry():
+    """Test numeric channels are interpolated and discrete ones carried forward"""
+    telemetry = pd.DataFrame({
+        'Time': pd.to_timedelta([0, 25, 50], unit='ms'),
+        'Speed': [100.0, 110.0, 120.0],
+        'Brake': [False, True, False],
+    })
+    
+    resampled = TelemetryProcessor.resample_telemetry(telemetry, frequency='10ms')
+    
+    assert resampled.columns.tolist() == ['Time', 'Speed', 'Brake']
+    assert resampled['Speed'].tolist() == pytest.approx([100.0, 104.0, 108.0, 112.0, 116.0, 120.0])
+    assert resampled['Brake'].tolist() == [False, False, False, True, True, False]
+    assert resampled['Brake'].dtype == bool
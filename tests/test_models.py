@@ -1,7 +1,7 @@
 """Test data models"""
 
 import pytest
-from src.models.data_models import LapData, TelemetryPoint, SectorData
+from src.models.data_models import Incident, LapData, TelemetryPoint, SectorData
 
 
 def test_lap_data_creation():
@@ -59,3 +59,13 @@ def test_sector_data():
     assert sector.driver == "HAM"
     assert sector.sector == 1
     assert sector.speed_trap == 310.0
+
+
+def test_incident():
+    """Test Incident slots dataclass and its JSON dict"""
+    incident = Incident(lap=12, type="Safety Car", reason="SAFETY CAR DEPLOYED")
+    
+    assert not hasattr(incident, '__dict__')
+    assert incident.to_dict() == {
+        'lap': 12, 'type': 'Safety Car', 'reason': 'SAFETY CAR DEPLOYED'
+    }